@@ -1,5 +1,6 @@
 """FastAPI Dependency Injection Container."""
 
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -25,9 +26,14 @@ _llm_client: LiteLLMAdapter | None = None
 _longterm_store: BaseStore | None = None
 _thread_memory: InMemorySaver | None = None
 _orchestrator: EnhancedLangGraphOrchestrator | None = None
+_memory: MemoryPort | None = None
 
+# Serialize first-time construction so concurrent cold requests build once
+_longterm_lock = asyncio.Lock()
+_orchestrator_lock = asyncio.Lock()
 
-def get_llm_client() -> LLMClientPort:
+
+async def get_llm_client() -> LLMClientPort:
     """Get or create LLM client (cached)."""
     global _llm_client
     if _llm_client is None:
@@ -43,33 +49,40 @@ def get_llm_client() -> LLMClientPort:
 async def get_longterm_memory_store() -> BaseStore:
     """Get or create long-term memory store (cached)."""
     global _longterm_store
-    if _longterm_store is None:
-        embeddings = init_embeddings("ollama:nomic-embed-text")
-        conn_pool = AsyncConnectionPool(
-            conninfo=os.getenv("POSTGRES_URL"),
-            min_size=1,
-            max_size=10,
-            open=False,
-        )
-        await conn_pool.open()
-
-        from langgraph.store.postgres import AsyncPostgresStore
-
-        _longterm_store = AsyncPostgresStore(
-            conn=conn_pool,
-            index={
-                "dims": 768,
-                "embed": embeddings,
-                "fields": ["content"],
-                "distance_type": "cosine",
-            },
-        )
-        await _longterm_store.setup()
+    if _longterm_store is not None:
+        return _longterm_store
+
+    async with _longterm_lock:
+        if _longterm_store is None:
+            embeddings = init_embeddings("ollama:nomic-embed-text")
+            conn_pool = AsyncConnectionPool(
+                conninfo=os.getenv("POSTGRES_URL"),
+                min_size=1,
+                max_size=10,
+                open=False,
+            )
+            await conn_pool.open()
+
+            from langgraph.store.postgres import AsyncPostgresStore
+
+            store = AsyncPostgresStore(
+                conn=conn_pool,
+                index={
+                    "dims": 768,
+                    "embed": embeddings,
+                    "fields": ["content"],
+                    "distance_type": "cosine",
+                },
+            )
+            await store.setup()
+            # Publish only after setup so the lock-free fast path never sees
+            # a half-initialized store
+            _longterm_store = store
 
     return _longterm_store
 
 
-def get_thread_memory() -> InMemorySaver:
+async def get_thread_memory() -> InMemorySaver:
     """Get or create thread memory (cached)."""
     global _thread_memory
     if _thread_memory is None:
@@ -82,12 +95,15 @@ async def get_memory(
     longterm_store: BaseStore = Depends(get_longterm_memory_store),
     thread_memory: InMemorySaver = Depends(get_thread_memory),
 ) -> MemoryPort:
-    """Get memory adapter with all dependencies."""
-    return InMemoryMemoryAdapter(
-        llm_client=llm,
-        thread_memory_saver=thread_memory,
-        longterm_memory_store=longterm_store,
-    )
+    """Get memory adapter with all dependencies (cached)."""
+    global _memory
+    if _memory is None:
+        _memory = InMemoryMemoryAdapter(
+            llm_client=llm,
+            thread_memory_saver=thread_memory,
+            longterm_memory_store=longterm_store,
+        )
+    return _memory
 
 
 async def get_orchestrator(
@@ -95,10 +111,38 @@ async def get_orchestrator(
 ) -> EnhancedLangGraphOrchestrator:
     """Get enhanced orchestrator with all dependencies."""
     global _orchestrator
-    if _orchestrator is None:
-        workspace = Path(os.getenv("NOVA_WORKSPACE", Path.home() / ".nova"))
-        _orchestrator = EnhancedLangGraphOrchestrator(
-            llm_client=llm,
-            workspace=workspace,
-        )
+    if _orchestrator is not None:
+        return _orchestrator
+
+    async with _orchestrator_lock:
+        if _orchestrator is None:
+            workspace = Path(os.getenv("NOVA_WORKSPACE", Path.home() / ".nova"))
+            _orchestrator = EnhancedLangGraphOrchestrator(
+                llm_client=llm,
+                workspace=workspace,
+            )
     return _orchestrator
+
+
+async def warm_up() -> None:
+    """Build the cached dependencies ahead of the first request.
+
+    The long-term store is only initialized when POSTGRES_URL is configured,
+    since no request path needs it otherwise.
+    """
+    llm = await get_llm_client()
+    await get_thread_memory()
+    await get_orchestrator(llm=llm)
+    if os.getenv("POSTGRES_URL"):
+        await get_longterm_memory_store()
+    logger.info("Dependencies initialized")
+
+
+async def shutdown() -> None:
+    """Release resources held by the cached dependencies."""
+    global _longterm_store, _memory
+    if _longterm_store is not None:
+        await _longterm_store.conn.close()
+        _longterm_store = None
+        _memory = None
+        logger.info("Long-term memory store closed")
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 import uuid
 import os
 from pathlib import Path
@@ -18,6 +19,7 @@ from langgraph.checkpoint.memory import InMemorySaver
 
 from app.domain.entities.agent_state import AgentState
 from app.domain.ports.llm_client_port import LLMClientPort
+from app.infrastructure import jsonio
 from app.infrastructure.tools import ToolRegistry
 from app.infrastructure.memory import MemoryStore, MemoryConsolidator
 from app.infrastructure.session import SessionManager
@@ -30,6 +32,47 @@ from app.application.services.nodes.context_builder_node import ContextBuilderNo
 
 logger = logging.getLogger(__name__)
 
+# Text-mode tool call header; arguments follow as a JSON object
+# Format: TOOL: tool_name
+# Arguments: {...}
+_TOOL_RE = re.compile(r"TOOL:\s*(\w+)\s*\n?Arguments:\s*", re.IGNORECASE)
+_JSON_DECODER = json.JSONDecoder()
+
+# LangChain message.type -> LiteLLM role. ToolExecutionNode emits one combined
+# ToolMessage with no matching assistant tool_calls entry, so its text is
+# passed back as user-visible context rather than as a "tool" role message.
+_ROLE_BY_MESSAGE_TYPE = {
+    "human": "user",
+    "ai": "assistant",
+    "system": "system",
+    "tool": "user",
+}
+
+
+def _prune_history(
+    messages: List[Dict[str, Any]], turn_start: Optional[int], keep: int
+) -> List[Dict[str, Any]]:
+    """Drop old history before an LLM call.
+
+    System messages are always kept. Everything from the current turn on is
+    kept, even if the tool loop has made it longer than keep.
+
+    Args:
+        messages: Role/content dicts in conversation order
+        turn_start: Index of the latest user message, if any
+        keep: Number of trailing messages to keep
+
+    Returns:
+        Pruned message list
+    """
+    start = max(len(messages) - keep, 0)
+    if turn_start is not None:
+        start = min(start, turn_start)
+    if start == 0:
+        return messages
+    system = [m for m in messages[:start] if m.get("role") == "system"]
+    return system + messages[start:]
+
 
 class EnhancedLangGraphOrchestrator:
     """Enhanced LangGraph orchestrator with new infrastructure integration."""
@@ -38,15 +81,19 @@ class EnhancedLangGraphOrchestrator:
         self,
         llm_client: LLMClientPort,
         workspace: Optional[Path] = None,
+        max_history_turns: int = 8,
     ):
         """Initialize enhanced orchestrator.
 
         Args:
             llm_client: LLM client for completions
             workspace: Path to workspace directory (default: ~/.nova)
+            max_history_turns: User/assistant turns of earlier history sent to
+                the LLM alongside the system prompt and the current turn
         """
         self.llm_client = llm_client
         self.workspace = Path(workspace or settings.workspace_dir)
+        self.max_history_turns = max_history_turns
 
         # Initialize new infrastructure components
         self._init_infrastructure()
@@ -68,7 +115,9 @@ class EnhancedLangGraphOrchestrator:
         )
 
         # Skills and context
-        self.context_builder = ContextBuilder(self.workspace)
+        self.context_builder = ContextBuilder(
+            self.workspace, memory_store=self.memory_store
+        )
 
         # Tool registry
         self.tool_registry = self._setup_tools()
@@ -128,6 +177,8 @@ class EnhancedLangGraphOrchestrator:
     def _init_nodes(self) -> None:
         """Initialize workflow nodes."""
         self.tool_execution_node = ToolExecutionNode(self.tool_registry)
+        # Tool set is fixed after _setup_tools, so build the schemas once
+        self._tool_definitions = self.tool_registry.get_definitions()
         self.context_builder_node = ContextBuilderNode(
             self.context_builder,
             self.memory_store,
@@ -211,21 +262,28 @@ class EnhancedLangGraphOrchestrator:
                 state_messages = state.messages
                 thread_id = state.thread_id
 
-            # Get tool definitions
-            tool_definitions = self.tool_registry.get_definitions()
+            tool_definitions = self._tool_definitions
 
-            # Convert messages to dict format for LiteLLM
+            # Convert messages to dict format for LiteLLM, remembering where
+            # the current turn (latest human message) starts
             messages = []
+            turn_start = None
             for msg in state_messages:
-                if hasattr(msg, "role") and hasattr(msg, "content"):
-                    messages.append(
-                        {
-                            "role": msg.role,
-                            "content": msg.content,
-                        }
-                    )
-                elif isinstance(msg, dict):
+                if isinstance(msg, dict):
+                    if msg.get("role") == "user":
+                        turn_start = len(messages)
                     messages.append(msg)
+                    continue
+                msg_type = getattr(msg, "type", None)
+                role = _ROLE_BY_MESSAGE_TYPE.get(msg_type)
+                if role:
+                    if msg_type == "human":
+                        turn_start = len(messages)
+                    messages.append({"role": role, "content": msg.content})
+
+            messages = _prune_history(
+                messages, turn_start, keep=2 * self.max_history_turns
+            )
 
             # Call LLM with tools if available
             response = await self.llm_client.chat_completion(
@@ -248,7 +306,7 @@ class EnhancedLangGraphOrchestrator:
                                 "name": tc.function.name,
                                 "arguments": tc.function.arguments
                                 if isinstance(tc.function.arguments, dict)
-                                else json.loads(tc.function.arguments),
+                                else jsonio.loads(tc.function.arguments),
                             }
                         )
                     elif isinstance(tc, dict):
@@ -276,28 +334,31 @@ class EnhancedLangGraphOrchestrator:
                     state.tool_calls = []
 
             # Add response to messages
-            from langchain_core.messages import AIMessage
-
-            content = response.get("response", "")
+            content = response.get("response", "") or ""
 
             if isinstance(state, dict):
                 state_messages = state.get("messages", [])
-                state_messages.append(AIMessage(content=content or ""))
+                state_messages.append(AIMessage(content=content))
                 state["messages"] = state_messages
+                state["last_ai_content"] = content
             else:
-                state.messages.append(AIMessage(content=content or ""))
+                state.messages.append(AIMessage(content=content))
+                state.last_ai_content = content
 
             logger.info(f"LLM node completed, response length: {len(content or '')}")
 
         except Exception as e:
             logger.error(f"Error in LLM node: {e}")
             # Handle both AgentState object and dict formats
+            error_content = f"Error: {str(e)}"
             if isinstance(state, dict):
                 state_messages = state.get("messages", [])
-                state_messages.append(AIMessage(content=f"Error: {str(e)}"))
+                state_messages.append(AIMessage(content=error_content))
                 state["messages"] = state_messages
+                state["last_ai_content"] = error_content
             else:
-                state.messages.append(AIMessage(content=f"Error: {str(e)}"))
+                state.messages.append(AIMessage(content=error_content))
+                state.last_ai_content = error_content
 
         return state
 
@@ -311,29 +372,26 @@ class EnhancedLangGraphOrchestrator:
         Returns:
             Updated state with tool calls
         """
-        import re
-        import json
-
         tool_calls = []
 
-        # Simple regex to parse tool calls
-        # Format: TOOL: tool_name
-        # Arguments: {...}
-        pattern = r"TOOL:\s*(\w+)\s*\n?Arguments:\s*(\{[^}]+\})"
-        matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-
-        for match in matches:
-            tool_name = match[0].strip()
+        # raw_decode consumes exactly one JSON value, so nested braces and
+        # "}" inside strings are handled correctly
+        for match in _TOOL_RE.finditer(content):
+            tool_name = match.group(1).strip()
             try:
-                args = json.loads(match[1])
-                tool_calls.append(
-                    {
-                        "name": tool_name,
-                        "arguments": args,
-                    }
-                )
+                args, _ = _JSON_DECODER.raw_decode(content, match.end())
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse arguments for tool {tool_name}")
+                continue
+            if not isinstance(args, dict):
+                logger.warning(f"Arguments for tool {tool_name} are not an object")
+                continue
+            tool_calls.append(
+                {
+                    "name": tool_name,
+                    "arguments": args,
+                }
+            )
 
         # Handle both AgentState object and dict formats
         if isinstance(state, dict):
@@ -388,20 +446,13 @@ class EnhancedLangGraphOrchestrator:
             # Handle both AgentState object and dict formats
             if isinstance(state, dict):
                 thread_id = state.get("thread_id", "default")
-                messages = state.get("messages", [])
+                last_ai_message = state.get("last_ai_content")
             else:
                 thread_id = state.thread_id
-                messages = state.messages
+                last_ai_message = state.last_ai_content
 
             session = self.session_manager.get_or_create(thread_id)
 
-            # Extract last AI message
-            last_ai_message = None
-            for msg in reversed(messages):
-                if hasattr(msg, "type") and msg.type == "ai":
-                    last_ai_message = msg.content
-                    break
-
             if last_ai_message:
                 session.add_message("assistant", last_ai_message or "(no response)")
 
@@ -455,25 +506,27 @@ class EnhancedLangGraphOrchestrator:
 
         # Execute graph
         try:
-            final_state = None
+            answered = False
             async for chunk in self.graph.astream(
-                initial_state, config, stream_mode="values"
+                initial_state, config, stream_mode="updates"
             ):
-                final_state = chunk
-
-            # Extract and yield response
-            # Handle both AgentState object and dict formats
-            messages = None
-            if isinstance(final_state, dict):
-                messages = final_state.get("messages", [])
-            elif hasattr(final_state, "messages"):
-                messages = final_state.messages
-
-            if messages:
-                for msg in reversed(messages):
-                    if hasattr(msg, "type") and msg.type == "ai":
-                        yield {"content": msg.content, "thread_id": thread_id}
-                        break
+                update = chunk.get("llm_node")
+                if answered or update is None:
+                    continue
+
+                # Handle both AgentState object and dict formats
+                if isinstance(update, dict):
+                    should_call = update.get("should_call_tools", False)
+                    last_ai_content = update.get("last_ai_content")
+                else:
+                    should_call = update.should_call_tools
+                    last_ai_content = update.last_ai_content
+
+                # Yield the final answer as soon as the LLM produces it; the
+                # memory consolidation and session save nodes run afterwards
+                if not should_call and last_ai_content is not None:
+                    yield {"content": last_ai_content, "thread_id": thread_id}
+                    answered = True
 
         except Exception as e:
             logger.error(f"Error in workflow: {e}")
@@ -1,11 +1,12 @@
 """Context builder node for LangGraph workflow."""
 
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from langchain_core.messages import SystemMessage
 
-from app.domain.entities.agent_state import AgentState
+from app.domain.entities.agent_state import AgentState, as_agent_state
 from app.infrastructure.skills import ContextBuilder
 from app.infrastructure.memory import MemoryStore
 
@@ -30,6 +31,35 @@ class ContextBuilderNode:
         self.context_builder = context_builder
         self.memory_store = memory_store
 
+    @staticmethod
+    def _find_last_human_index(
+        messages: list, known_index: Optional[int] = None
+    ) -> Optional[int]:
+        """Find the index of the latest human message.
+
+        If known_index still points at a human message, only the messages
+        after it are scanned.
+
+        Args:
+            messages: Conversation messages
+            known_index: Previously found human message index, if any
+
+        Returns:
+            Index of the last human message, or None if there is none
+        """
+        stop = -1
+        if (
+            known_index is not None
+            and 0 <= known_index < len(messages)
+            and getattr(messages[known_index], "type", None) == "human"
+        ):
+            stop = known_index
+
+        for index in range(len(messages) - 1, stop, -1):
+            if getattr(messages[index], "type", None) == "human":
+                return index
+        return stop if stop >= 0 else None
+
     async def execute_node(self, state: AgentState) -> AgentState:
         """Build context with skills and memory.
 
@@ -42,24 +72,22 @@ class ContextBuilderNode:
         logger.info("Building context with skills and memory")
 
         # Handle both AgentState object and dict formats
-        if isinstance(state, dict):
-            messages = state.get("messages", [])
-        else:
-            messages = state.messages
+        view = as_agent_state(state)
+        messages = view.messages
 
         # Get the latest user message
-        latest_message = None
-        for msg in reversed(messages):
-            if hasattr(msg, "type") and msg.type == "human":
-                latest_message = msg.content
-                break
+        human_index = self._find_last_human_index(messages, view.last_human_index)
+        latest_message = (
+            messages[human_index].content if human_index is not None else None
+        )
 
         if not latest_message:
             logger.warning("No user message found in state")
             return state
 
-        # Build system prompt with skills context
-        system_prompt = self.context_builder.build_system_prompt(
+        # Build system prompt with skills context (reads skills and memory files)
+        system_prompt = await asyncio.to_thread(
+            self.context_builder.build_system_prompt,
             include_memory=True,
             include_skills=True,
         )
@@ -75,6 +103,9 @@ class ContextBuilderNode:
             messages[0] = SystemMessage(content=system_prompt)
         else:
             messages.insert(0, SystemMessage(content=system_prompt))
+            human_index += 1
+
+        view.last_human_index = human_index
 
         logger.info("Context built successfully")
         return state
@@ -1,10 +1,14 @@
 """Tool execution node for LangGraph workflow."""
 
+import asyncio
+import io
 import json
 import logging
 from typing import Dict, Any, List
 
-from app.domain.entities.agent_state import AgentState
+from langchain_core.messages import ToolMessage
+
+from app.domain.entities.agent_state import AgentState, as_agent_state
 from app.infrastructure.tools import ToolRegistry
 
 
@@ -22,6 +26,45 @@ class ToolExecutionNode:
         """
         self.tool_registry = tool_registry
 
+    async def _run_one(self, tool_call: Any) -> Dict[str, Any]:
+        """Execute a single tool call and describe the outcome.
+
+        Args:
+            tool_call: Pydantic ToolCall model or dict with name/arguments
+
+        Returns:
+            Result dict with tool, arguments, result and success keys
+        """
+        # Handle both Pydantic ToolCall model and dict format
+        if hasattr(tool_call, "function"):
+            tool_name = tool_call.function.name
+            tool_args = tool_call.function.arguments
+        else:
+            tool_name = tool_call.get("name", "")
+            tool_args = tool_call.get("arguments", {})
+
+        logger.info("Executing tool: %s with args: %r", tool_name, tool_args)
+
+        try:
+            result = await self.tool_registry.execute(tool_name, tool_args)
+            logger.info("Tool %s executed successfully", tool_name)
+            return {
+                "tool": tool_name,
+                "arguments": tool_args,
+                "result": result,
+                "success": True,
+            }
+
+        except Exception as e:
+            error_msg = f"Error executing {tool_name}: {str(e)}"
+            logger.error(error_msg)
+            return {
+                "tool": tool_name,
+                "arguments": tool_args,
+                "result": error_msg,
+                "success": False,
+            }
+
     async def execute_node(self, state: AgentState) -> AgentState:
         """Execute tools requested by the LLM.
 
@@ -32,74 +75,38 @@ class ToolExecutionNode:
             Updated agent state with tool results
         """
         # Handle both AgentState object and dict formats
-        if isinstance(state, dict):
-            tool_calls = state.get("tool_calls", [])
-            messages = state.get("messages", [])
-        else:
-            tool_calls = state.tool_calls
-            messages = state.messages
+        view = as_agent_state(state)
+        tool_calls = view.tool_calls
 
         if not tool_calls:
             logger.info("No tool calls to execute")
             return state
 
-        tool_results = []
-
-        for tool_call in tool_calls:
-            # Handle both Pydantic ToolCall model and dict format
-            if hasattr(tool_call, "function"):
-                tool_name = tool_call.function.name
-                tool_args = tool_call.function.arguments
-            else:
-                tool_name = tool_call.get("name", "")
-                tool_args = tool_call.get("arguments", {})
-
-            logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
-
-            try:
-                result = await self.tool_registry.execute(tool_name, tool_args)
-                tool_results.append(
-                    {
-                        "tool": tool_name,
-                        "arguments": tool_args,
-                        "result": result,
-                        "success": True,
-                    }
-                )
-                logger.info(f"Tool {tool_name} executed successfully")
-
-            except Exception as e:
-                error_msg = f"Error executing {tool_name}: {str(e)}"
-                logger.error(error_msg)
-                tool_results.append(
-                    {
-                        "tool": tool_name,
-                        "arguments": tool_args,
-                        "result": error_msg,
-                        "success": False,
-                    }
-                )
-
-        # Store tool results in state
-        if isinstance(state, dict):
-            state["tool_results"] = tool_results
-            state["should_call_tools"] = False  # Reset flag
-            messages = state.get("messages", [])
-        else:
-            state.tool_results = tool_results
-            state.should_call_tools = False  # Reset flag
-            messages = state.messages
-
-        # Add tool results to messages for LLM context
-        results_text = "\n".join(
-            [f"Tool: {r['tool']}\nResult: {r['result']}" for r in tool_results]
+        # Independent tool calls run concurrently; _run_one never raises, so
+        # one failing tool does not cancel the others and order is preserved
+        tool_results = await asyncio.gather(
+            *(self._run_one(tool_call) for tool_call in tool_calls)
         )
 
-        from langchain_core.messages import ToolMessage
+        # Store tool results in state
+        view.tool_results = tool_results
+        view.should_call_tools = False  # Reset flag
+        messages = view.messages
+
+        # Add tool results to messages for LLM context. Results can be large
+        # (file contents, fetched pages), so write them into one buffer rather
+        # than building per-result strings and joining them.
+        buf = io.StringIO()
+        buf.write("Tool execution results:")
+        for r in tool_results:
+            buf.write("\nTool: ")
+            buf.write(r["tool"])
+            buf.write("\nResult: ")
+            buf.write(str(r["result"]))
 
         messages.append(
             ToolMessage(
-                content=f"Tool execution results:\n{results_text}",
+                content=buf.getvalue(),
                 tool_call_id="tool_execution",
             )
         )
@@ -14,6 +14,8 @@ class AgentState(BaseModel):
     user_id: Optional[str] = Field(default=None)
     thread_id: Optional[str] = Field(default=None)
     messages: Annotated[List[AnyMessage], add_messages]
+    # Position of the latest human message in messages (None = unknown)
+    last_human_index: Optional[int] = Field(default=None)
     # Classification intent
     intent: Optional[str] = Field(default=None)
     # Plan Mode
@@ -35,7 +37,56 @@ class AgentState(BaseModel):
     tool_results: Optional[List[ToolResult]] = Field(default=None)
     should_call_tools: bool = Field(default=False)
 
+    # Content of the most recent AI message, kept so readers skip a reverse scan
+    last_ai_content: Optional[str] = Field(default=None)
+
     final_output: Optional[str] = Field(default=None)
 
     class Config:
         arbitrary_types_allowed = True
+
+
+class AgentStateView:
+    """Attribute-style view over a LangGraph state dict.
+
+    Reads fall back to the AgentState field defaults for missing keys and
+    writes go straight into the underlying dict, so nodes can treat dict and
+    AgentState inputs the same way.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        object.__setattr__(self, "_data", data)
+
+    def __getattr__(self, name: str) -> Any:
+        data = object.__getattribute__(self, "_data")
+        if name in data:
+            return data[name]
+        field = AgentState.model_fields.get(name)
+        if field is None:
+            raise AttributeError(name)
+        # Required fields (messages) default to an empty list stored in the
+        # dict, so in-place appends are kept
+        if field.is_required():
+            return data.setdefault(name, [])
+        return field.get_default(call_default_factory=True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__getattribute__(self, "_data")[name] = value
+
+
+def as_agent_state(
+    state: Union[AgentState, Dict[str, Any]],
+) -> Union[AgentState, AgentStateView]:
+    """Give dict and AgentState node inputs the same attribute interface.
+
+    Args:
+        state: Agent state model or LangGraph state dict
+
+    Returns:
+        The model itself, or an AgentStateView wrapping the dict
+    """
+    if isinstance(state, dict):
+        return AgentStateView(state)
+    return state
@@ -6,6 +6,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.adapters.config import settings
+from app.dependencies import shutdown, warm_up
 from app.interfaces.api.endpoints import chat_router
 
 
@@ -17,8 +18,14 @@ async def lifespan(app: FastAPI):
     logging.basicConfig(format="{levelname:7} {message}", style="{", level=logging.INFO)
     handler = logging.StreamHandler()
     logger.addHandler(handler)
+
+    # Build LLM client, orchestrator and stores before serving requests
+    await warm_up()
     yield
 
+    # Shutdown
+    await shutdown()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
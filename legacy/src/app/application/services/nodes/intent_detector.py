@@ -1,20 +1,79 @@
 """Intent Detector Service for AI agent workflow."""
 
 import logging
-from typing import Optional
+import re
+from collections import OrderedDict
+from typing import Any, Optional
+
+from langchain_core.messages import HumanMessage
+
 from app.domain.entities.agent_state import AgentState
 from app.domain.ports.llm_client_port import LLMClientPort
 from app.domain.parsers.think_cleaner_parser import ThinkCleanerParser
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of classified messages remembered by the intent cache
+INTENT_CACHE_SIZE = 1024
+
+# Rule-based fast path, checked before the LLM is consulted.
+# Messages that are nothing but a greeting or acknowledgement
+_CHAT_RE = re.compile(
+    r"^\s*(hi|hello|hey|thanks?|thank you|ok(ay)?|bye)\b[\s!.,?]*$", re.IGNORECASE
+)
+# Explicit planning vocabulary anywhere in the message
+_PLANNING_RE = re.compile(
+    r"\b(plan|strategy|step[- ]by[- ]step|break (it )?down|roadmap|outline)\b",
+    re.IGNORECASE,
+)
+
+
+def _extract_latest_user_text(messages: list[Any]) -> Optional[str]:
+    """Return the content of the most recent user message, if any.
+
+    Args:
+        messages: Conversation messages (LangChain messages, role/content
+            objects or plain dicts)
+
+    Returns:
+        Text of the latest user turn, or None if there is none
+    """
+    i = len(messages) - 1
+    while i >= 0:
+        match messages[i]:
+            case HumanMessage(content=content):
+                return str(content)
+            case {"role": "user", "content": content}:
+                return str(content)
+            case object(type="human", content=content):
+                return str(content)
+            case object(role="user", content=content):
+                return str(content)
+        i -= 1
+    return None
+
 
 class IntentDetector:
     """Detects user intent from messages using LLM for autonomous classification."""
 
-    def __init__(self, llm_client: LLMClientPort):
+    def __init__(self, llm_client: LLMClientPort, cache_size: int = INTENT_CACHE_SIZE):
         self.llm_client = llm_client
         self.think_cleaner = ThinkCleanerParser()
+        # LRU of normalized message text -> intent label, skips repeat LLM calls
+        self._intent_cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_size = cache_size
+
+    @staticmethod
+    def _cache_key(message: str) -> str:
+        """Normalize a message so trivially different phrasings share a key."""
+        return " ".join(message.casefold().split())
+
+    def _remember_intent(self, key: str, intent: str) -> None:
+        """Store a classification, evicting the least recently used entry."""
+        self._intent_cache[key] = intent
+        self._intent_cache.move_to_end(key)
+        if len(self._intent_cache) > self._cache_size:
+            self._intent_cache.popitem(last=False)
 
     async def detect_intent(self, state: AgentState) -> AgentState:
         """Detect user intent using LLM for autonomous classification.
@@ -27,17 +86,7 @@ class IntentDetector:
         """
 
         # Get the latest user message
-        latest_message: Optional[str] = None
-        for msg in reversed(state.messages):
-            # Handle different message types and formats
-            if hasattr(msg, "type") and hasattr(msg, "content"):
-                if msg.type == "human":  # type: ignore
-                    latest_message = str(msg.content)  # type: ignore
-                    break
-            elif hasattr(msg, "role") and hasattr(msg, "content"):
-                if msg.role == "user":  # type: ignore
-                    latest_message = str(msg.content)  # type: ignore
-                    break
+        latest_message = _extract_latest_user_text(state.messages)
 
         if not latest_message:
             logger.warning("No human/user message found in state.messages")
@@ -46,6 +95,26 @@ class IntentDetector:
             state.intent = "general_chat"
             return state
 
+        if _CHAT_RE.match(latest_message):
+            state.needs_planning = False
+            state.intent = "general_chat"
+            logger.info("Intent detected by rule: general_chat")
+            return state
+        if _PLANNING_RE.search(latest_message):
+            state.needs_planning = True
+            state.intent = "planning"
+            logger.info("Intent detected by rule: planning")
+            return state
+
+        cache_key = self._cache_key(latest_message)
+        cached_intent = self._intent_cache.get(cache_key)
+        if cached_intent is not None:
+            self._intent_cache.move_to_end(cache_key)
+            state.needs_planning = cached_intent == "planning"
+            state.intent = cached_intent
+            logger.info(f"Intent cache hit: {cached_intent}")
+            return state
+
         # Use LLM to classify intent
         intent_prompt = f"""
         Analyze the following user message and classify its intent. Choose ONE of these categories:
@@ -79,12 +148,14 @@ class IntentDetector:
             if intent == "planning":
                 state.needs_planning = True
                 state.intent = "planning"
+                self._remember_intent(cache_key, intent)
                 logger.info(
                     f"LLM detected planning intent for message: {latest_message[:100]}..."
                 )
             elif intent == "general_chat":
                 state.needs_planning = False
                 state.intent = "general_chat"
+                self._remember_intent(cache_key, intent)
                 logger.info(
                     f"LLM detected general_chat intent for message: {latest_message[:100]}..."
                 )
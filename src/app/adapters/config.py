@@ -1,25 +1,39 @@
 """Configuration settings for Nova Agent API."""
 
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Truthy spellings accepted by pydantic-settings, which this module replaced
+_TRUE_VALUES = ("1", "t", "true", "y", "yes", "on")
 
-class Settings(BaseSettings):
-    """Application settings."""
+
+def _env_bool(name: str, default: str) -> bool:
+    """Read a boolean environment variable."""
+    return os.getenv(name, default).strip().lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings.
+
+    Values are read from the environment once, when this module is imported.
+    """
 
     # API Settings
-    api_title: str = "Nova Agent API"
-    api_version: str = "0.1.0"
-    api_description: str = "A powerful agent-based API service"
+    api_title: str = os.getenv("API_TITLE", "Nova Agent API")
+    api_version: str = os.getenv("API_VERSION", "0.1.0")
+    api_description: str = os.getenv(
+        "API_DESCRIPTION", "A powerful agent-based API service"
+    )
 
     # Server Settings
-    host: str = "0.0.0.0"
-    port: int = 8000
-    reload: bool = True
+    host: str = os.getenv("HOST", "0.0.0.0")
+    port: int = int(os.getenv("PORT", "8000"))
+    reload: bool = _env_bool("RELOAD", "true")
 
     # LiteLLM Settings (Multi-Provider)
     # Format: "provider/model-name" (e.g., "groq/openai/gpt-oss-20b")
@@ -36,15 +50,10 @@ class Settings(BaseSettings):
 
     # Pydantic AI Settings
     pydantic_ai_max_retries: int = int(os.getenv("PYDANTIC_AI_MAX_RETRIES", "3"))
-    pydantic_ai_validation_debug: bool = (
-        os.getenv("PYDANTIC_AI_VALIDATION_DEBUG", "false").lower() == "true"
-    )
-    pydantic_ai_async_only: bool = (
-        os.getenv("PYDANTIC_AI_ASYNC_ONLY", "true").lower() == "true"
+    pydantic_ai_validation_debug: bool = _env_bool(
+        "PYDANTIC_AI_VALIDATION_DEBUG", "false"
     )
-
-    class Config:
-        case_sensitive = False
+    pydantic_ai_async_only: bool = _env_bool("PYDANTIC_AI_ASYNC_ONLY", "true")
 
 
 # Global settings instance
@@ -108,16 +108,22 @@ class LiteLLMAdapter(LLMClientPort):
         """
         self.model = model or settings.lite_llm_model
         self.api_key = api_key or settings.lite_llm_api_key
+        # Resolved once; a blank key means "let LiteLLM use provider env vars"
+        self._resolved_api_key = (
+            self.api_key if self.api_key and self.api_key.strip() else None
+        )
         self.temperature = temperature
         self.max_tokens = max_tokens
 
+        # Last tool list passed in and its Groq-cleaned copy
+        self._cleaned_tools_source: Optional[List[Dict[str, Any]]] = None
+        self._cleaned_tools: List[Dict[str, Any]] = []
+
         logger.info(f"LiteLLM adapter initialized with model: {self.model}")
 
     def _get_api_key(self) -> Optional[str]:
         """Get API key, returning None if empty string."""
-        if self.api_key and self.api_key.strip():
-            return self.api_key
-        return None
+        return self._resolved_api_key
 
     def get_llm_client(self):
         """Get the underlying LLM client.
@@ -204,25 +210,7 @@ class LiteLLMAdapter(LLMClientPort):
 
             # Add tools if provided - filter Groq-incompatible fields
             if tools:
-                cleaned_tools = []
-                for tool in tools:
-                    # Clean up tool definitions for Groq
-                    cleaned_tool = {}
-                    if "type" in tool:
-                        cleaned_tool["type"] = tool["type"]
-                    if "function" in tool:
-                        func = {}
-                        if "name" in tool["function"]:
-                            func["name"] = tool["function"]["name"]
-                        if "description" in tool["function"]:
-                            func["description"] = tool["function"]["description"]
-                        # Handle parameters - remove Groq-incompatible fields
-                        if "parameters" in tool["function"]:
-                            params = tool["function"]["parameters"]
-                            func["parameters"] = self._clean_groq_parameters(params)
-                        cleaned_tool["function"] = func
-                    cleaned_tools.append(cleaned_tool)
-                kwargs["tools"] = cleaned_tools
+                kwargs["tools"] = self._clean_tools(tools)
                 kwargs["tool_choice"] = "auto"
 
             response = await acompletion(**kwargs)
@@ -254,6 +242,44 @@ class LiteLLMAdapter(LLMClientPort):
                 "memory_used": False,
             }
 
+    def _clean_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Clean tool definitions for Groq compatibility.
+
+        Tool definitions are static for the lifetime of a registry, so the
+        cleaned copy is reused while callers keep passing the same list object.
+        Callers must pass a new list (not mutate the old one) when tools change.
+
+        Args:
+            tools: Tool definitions in OpenAI format
+
+        Returns:
+            Cleaned tool definitions
+        """
+        if tools is self._cleaned_tools_source:
+            return self._cleaned_tools
+
+        cleaned_tools = []
+        for tool in tools:
+            cleaned_tool = {}
+            if "type" in tool:
+                cleaned_tool["type"] = tool["type"]
+            if "function" in tool:
+                func = {}
+                if "name" in tool["function"]:
+                    func["name"] = tool["function"]["name"]
+                if "description" in tool["function"]:
+                    func["description"] = tool["function"]["description"]
+                # Handle parameters - remove Groq-incompatible fields
+                if "parameters" in tool["function"]:
+                    params = tool["function"]["parameters"]
+                    func["parameters"] = self._clean_groq_parameters(params)
+                cleaned_tool["function"] = func
+            cleaned_tools.append(cleaned_tool)
+
+        self._cleaned_tools_source = tools
+        self._cleaned_tools = cleaned_tools
+        return cleaned_tools
+
     def _clean_groq_parameters(self, params: dict) -> dict:
         """Clean parameter schema for Groq compatibility."""
         cleaned = {}
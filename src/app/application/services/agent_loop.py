@@ -7,10 +7,9 @@ This implements a simplified agent loop that:
 """
 
 import asyncio
-import json
 import logging
 from pathlib import Path
-from typing import Optional, Callable, Awaitable, List, Dict, Any
+from typing import Optional, Callable, Awaitable, List, Dict, Any, NamedTuple
 
 from app.infrastructure.bus.events import InboundMessage, OutboundMessage
 from app.infrastructure.bus.queue import MessageBus
@@ -18,12 +17,66 @@ from app.domain.ports.llm_client_port import LLMClientPort
 from app.infrastructure.tools import ToolRegistry
 from app.infrastructure.skills import ContextBuilder
 from app.infrastructure.session import SessionManager
+from app.infrastructure import jsonio
 from app.infrastructure.memory import MemoryStore
 
 
 logger = logging.getLogger(__name__)
 
 
+class ParsedToolCall(NamedTuple):
+    """Provider-agnostic view of a single tool call."""
+
+    id: str
+    name: str
+    args: Dict[str, Any]
+    args_json: str
+
+
+def _normalize_tool_calls(
+    tool_calls: List[Any], id_offset: int = 0
+) -> List[ParsedToolCall]:
+    """Normalize provider tool calls into ParsedToolCall tuples.
+
+    Handles both LiteLLM tool call objects and OpenAI-style dicts, with
+    arguments given either as a JSON string or an already parsed dict.
+
+    Args:
+        tool_calls: Tool calls from the LLM response
+        id_offset: Number used for the first fallback call id
+
+    Returns:
+        Normalized tool calls; entries without a tool name are dropped
+    """
+    parsed: List[ParsedToolCall] = []
+    for tc in tool_calls:
+        default_id = f"call_{id_offset + len(parsed)}"
+        if isinstance(tc, dict):
+            func_info = tc.get("function", {})
+            tool_name = func_info.get("name", "")
+            raw_args = func_info.get("arguments", {})
+            tool_id = tc.get("id") or default_id
+        else:
+            function = getattr(tc, "function", None)
+            tool_name = getattr(function, "name", None)
+            raw_args = getattr(function, "arguments", None)
+            tool_id = getattr(tc, "id", None) or default_id
+
+        if not tool_name:
+            logger.warning(f"Skipping tool call with no name: {tc}")
+            continue
+
+        if isinstance(raw_args, str):
+            args_json = raw_args
+            tool_args = jsonio.loads(raw_args) if raw_args else {}
+        else:
+            tool_args = raw_args or {}
+            args_json = jsonio.dumps(tool_args).decode("utf-8")
+
+        parsed.append(ParsedToolCall(tool_id, tool_name, tool_args, args_json))
+    return parsed
+
+
 class AgentLoop:
     """Simple agent loop with tool calling (nanobot-style).
 
@@ -42,6 +95,7 @@ class AgentLoop:
         tool_registry: ToolRegistry,
         max_iterations: int = 10,
         memory_window: int = 50,
+        session_flush_interval: float = 5.0,
     ):
         self.bus = bus
         self.llm_client = llm_client
@@ -49,40 +103,81 @@ class AgentLoop:
         self.tool_registry = tool_registry
         self.max_iterations = max_iterations
         self.memory_window = memory_window
+        self.session_flush_interval = session_flush_interval
 
-        self.context_builder = ContextBuilder(workspace)
-        self.session_manager = SessionManager(workspace)
         self.memory_store = MemoryStore(workspace)
+        self.context_builder = ContextBuilder(workspace, memory_store=self.memory_store)
+        self.session_manager = SessionManager(workspace)
 
         self._running = False
         self._task = None
 
+        # Consolidation runs one at a time; bursts beyond the queue are dropped
+        self._consolidation_queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+        self._consolidation_worker = None
+        self._session_flusher = None
+        self._flush_lock = asyncio.Lock()
+
     async def start(self) -> None:
         self._running = True
         self._task = asyncio.create_task(self._run_loop())
+        self._consolidation_worker = asyncio.create_task(
+            self._run_consolidation_worker()
+        )
+        self._session_flusher = asyncio.create_task(self._run_session_flusher())
         logger.info("AgentLoop started")
 
     async def stop(self) -> None:
         self._running = False
-        if self._task:
-            self._task.cancel()
+        for task in (self._task, self._consolidation_worker, self._session_flusher):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        # Persist whatever the flusher had not written yet
+        await self._flush_sessions()
+        logger.info("AgentLoop stopped")
+
+    async def _run_session_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self.session_flush_interval)
             try:
-                await self._task
+                await self._flush_sessions()
+            except Exception as e:
+                logger.error(f"Error flushing sessions: {e}", exc_info=True)
+
+    async def _flush_sessions(self) -> None:
+        # One flush at a time, so an older snapshot never lands after a newer one
+        async with self._flush_lock:
+            # Serialize on the loop, where sessions are mutated; only the file
+            # writes go to a worker thread
+            snapshots = self.session_manager.snapshot_dirty()
+            if not snapshots:
+                return
+            # Cancelling can't stop the worker thread, so wait for it before
+            # releasing the lock (stop() flushes again right after cancelling)
+            write = asyncio.create_task(
+                asyncio.to_thread(self.session_manager.write_snapshots, snapshots)
+            )
+            try:
+                await asyncio.shield(write)
             except asyncio.CancelledError:
-                pass
-        logger.info("AgentLoop stopped")
+                await write
+                raise
 
     async def _run_loop(self) -> None:
         while self._running:
             try:
-                msg = await asyncio.wait_for(self.bus.consume_inbound(), timeout=1.0)
+                # Blocks until a message arrives; stop() cancels the task.
+                # Taking one at a time leaves the backlog in the bounded queue.
+                msg = await self.bus.consume_inbound()
 
                 response = await self._process_message(msg)
                 if response:
                     await self.bus.publish_outbound(response)
 
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -92,19 +187,22 @@ class AgentLoop:
         try:
             logger.info(f"Processing message from {msg.channel}:{msg.sender_id}")
 
-            session = self.session_manager.get_or_create(msg.session_key)
-
-            system_prompt = self.context_builder.build_system_prompt(
-                include_memory=True,
-                include_skills=True,
+            # Session load and prompt build are independent disk reads
+            session, system_prompt = await asyncio.gather(
+                asyncio.to_thread(self.session_manager.get_or_create, msg.session_key),
+                asyncio.to_thread(
+                    self.context_builder.build_system_prompt,
+                    include_memory=True,
+                    include_skills=True,
+                ),
             )
 
-            messages = [{"role": "system", "content": system_prompt}]
-
+            # History is already capped at memory_window by get_history
             history = session.get_history(max_messages=self.memory_window)
-            for h in history:
-                messages.append({"role": h["role"], "content": h["content"]})
-
+            messages = [{"role": "system", "content": system_prompt}]
+            messages.extend(
+                {"role": h["role"], "content": h["content"]} for h in history
+            )
             messages.append({"role": "user", "content": msg.content})
 
             final_content, tools_used = await self._run_agent_loop(messages=messages)
@@ -114,10 +212,15 @@ class AgentLoop:
 
             session.add_message("user", msg.content)
             session.add_message("assistant", final_content, tools_used=tools_used)
-            self.session_manager.save(session)
+            self.session_manager.save_later(session)
 
             if len(session.messages) > self.memory_window:
-                asyncio.create_task(self._consolidate_memory(session))
+                try:
+                    self._consolidation_queue.put_nowait(session)
+                except asyncio.QueueFull:
+                    logger.warning(
+                        f"Consolidation queue full, skipping session {session.key}"
+                    )
 
             logger.info(
                 f"Response generated: {len(final_content)} chars, tools: {tools_used}"
@@ -147,12 +250,11 @@ class AgentLoop:
         iteration = 0
         tools_used: List[str] = []
         final_content = None
+        tool_definitions = self.tool_registry.get_definitions()
 
         while iteration < self.max_iterations:
             iteration += 1
 
-            tool_definitions = self.tool_registry.get_definitions()
-
             response = await self.llm_client.chat_completion(
                 messages=messages,
                 tools=tool_definitions if tool_definitions else None,
@@ -165,22 +267,17 @@ class AgentLoop:
                     f"LLM requested {len(tool_calls)} tool calls (iteration {iteration})"
                 )
 
-                tool_call_dicts = []
-                for tc in tool_calls:
-                    if hasattr(tc, "function"):
-                        tool_call_dicts.append(
-                            {
-                                "id": getattr(tc, "id", f"call_{len(tools_used)}"),
-                                "type": "function",
-                                "function": {
-                                    "name": tc.function.name,
-                                    "arguments": json.dumps(tc.function.arguments),
-                                },
-                            }
-                        )
-                        tools_used.append(tc.function.name)
-                    elif isinstance(tc, dict):
-                        tool_call_dicts.append(tc)
+                calls = _normalize_tool_calls(tool_calls, id_offset=len(tools_used))
+                tools_used.extend(call.name for call in calls)
+
+                tool_call_dicts = [
+                    {
+                        "id": call.id,
+                        "type": "function",
+                        "function": {"name": call.name, "arguments": call.args_json},
+                    }
+                    for call in calls
+                ]
 
                 messages.append(
                     {
@@ -190,43 +287,38 @@ class AgentLoop:
                     }
                 )
 
-                for tc in tool_calls:
-                    tool_name = None
-                    tool_args = {}
-                    tool_id = f"call_{len(tools_used)}"
-
-                    if hasattr(tc, "function"):
-                        tool_name = tc.function.name
-                        tool_args = (
-                            tc.function.arguments
-                            if isinstance(tc.function.arguments, dict)
-                            else json.loads(tc.function.arguments)
-                        )
-                        tool_id = getattr(tc, "id", tool_id)
-                    elif isinstance(tc, dict):
-                        func_info = tc.get("function", {})
-                        tool_name = func_info.get("name", "")
-                        tool_args = func_info.get("arguments", {})
-                        tool_id = tc.get("id", tool_id)
-
-                    if not tool_name:
-                        logger.warning(f"Skipping tool call with no name: {tc}")
-                        continue
-
-                    logger.info(f"Executing tool: {tool_name}({tool_args})")
-
-                    try:
-                        result = await self.tool_registry.execute(tool_name, tool_args)
-                        tool_result = str(result)
-                    except Exception as e:
-                        tool_result = f"Error executing {tool_name}: {str(e)}"
+                for call in calls:
+                    logger.info("Executing tool: %s(%r)", call.name, call.args)
+
+                results = await asyncio.gather(
+                    *(
+                        self.tool_registry.execute(call.name, call.args)
+                        for call in calls
+                    ),
+                    return_exceptions=True,
+                )
+
+                # Tool errors become tool messages, but cancellation and other
+                # BaseExceptions must still propagate
+                for result in results:
+                    if isinstance(result, BaseException) and not isinstance(
+                        result, Exception
+                    ):
+                        raise result
+
+                # gather preserves order, so results line up with tool_call ids
+                for call, result in zip(calls, results):
+                    if isinstance(result, Exception):
+                        tool_result = f"Error executing {call.name}: {str(result)}"
                         logger.error(tool_result)
+                    else:
+                        tool_result = str(result)
 
                     messages.append(
                         {
                             "role": "tool",
-                            "tool_call_id": tool_id,
-                            "name": tool_name,
+                            "tool_call_id": call.id,
+                            "name": call.name,
                             "content": tool_result,
                         }
                     )
@@ -245,35 +337,41 @@ class AgentLoop:
 
         return final_content, tools_used
 
-    async def _consolidate_memory(self, session) -> None:
-        try:
-            keep_count = self.memory_window // 2
-            if len(session.messages) <= keep_count:
-                return
+    async def _run_consolidation_worker(self) -> None:
+        while True:
+            session = await self._consolidation_queue.get()
+            try:
+                await self._consolidate_memory(session)
+            except Exception as e:
+                logger.error(f"Error in consolidation worker: {e}", exc_info=True)
+            finally:
+                self._consolidation_queue.task_done()
 
-            old_messages = session.messages[:-keep_count]
-            if not old_messages:
-                return
+    def _build_consolidation_prompt(self, old_messages: List[Any]) -> str:
+        """Build the consolidation prompt from old session messages.
 
-            logger.info(f"Memory consolidation: {len(old_messages)} messages")
+        Runs in a worker thread: it joins the whole transcript and reads
+        MEMORY.md from disk.
 
-            lines = []
-            for m in old_messages:
-                if not m.get("content"):
-                    continue
-                tools = (
-                    f" [tools: {', '.join(m.get('tools_used', []))}]"
-                    if m.get("tools_used")
-                    else ""
-                )
-                lines.append(
-                    f"[{m.get('timestamp', '?')[:16]}] {m['role'].upper()}{tools}: {m['content']}"
-                )
+        Args:
+            old_messages: Session messages being folded into memory
 
-            conversation = "\n".join(lines)
-            current_memory = self.memory_store.read_long_term()
+        Returns:
+            Prompt for the consolidation LLM call
+        """
+        lines = []
+        for m in old_messages:
+            if not m.content:
+                continue
+            tools = f" [tools: {', '.join(m.tools_used)}]" if m.tools_used else ""
+            lines.append(
+                f"[{m.timestamp.isoformat()[:16]}] {m.role.upper()}{tools}: {m.content}"
+            )
+
+        conversation = "\n".join(lines)
+        current_memory = self.memory_store.read_long_term()
 
-            prompt = f"""Consolidate this conversation into memory. Return JSON with:
+        return f"""Consolidate this conversation into memory. Return JSON with:
 {{
   "history_entry": "Brief summary for HISTORY.md",
   "memory_update": "Updated MEMORY.md content (add new facts, keep existing)"
@@ -285,6 +383,23 @@ Current MEMORY.md:
 Conversation:
 {conversation}"""
 
+    async def _consolidate_memory(self, session) -> None:
+        try:
+            keep_count = self.memory_window // 2
+            if len(session.messages) <= keep_count:
+                return
+
+            old_messages = session.messages[:-keep_count]
+            if not old_messages:
+                return
+
+            logger.info(f"Memory consolidation: {len(old_messages)} messages")
+
+            # Joining the transcript and reading MEMORY.md are blocking work
+            prompt = await asyncio.to_thread(
+                self._build_consolidation_prompt, old_messages
+            )
+
             response = await self.llm_client.chat_completion(
                 messages=[
                     {
@@ -296,15 +411,16 @@ Conversation:
                 streaming=False,
             )
 
-            result = json.loads(response.get("response", "{}"))
+            result = jsonio.loads(response.get("response") or "{}")
 
             if entry := result.get("history_entry"):
-                self.memory_store.append_history(entry)
+                await asyncio.to_thread(self.memory_store.append_history, entry)
 
             if update := result.get("memory_update"):
-                self.memory_store.write_long_term(update)
+                await asyncio.to_thread(self.memory_store.write_long_term, update)
 
             session.last_consolidated = len(session.messages) - keep_count
+            self.session_manager.save_later(session)
             logger.info("Memory consolidation completed")
 
         except Exception as e:
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class InboundMessage:
     """Message received from a channel."""
 
@@ -14,14 +14,14 @@ class InboundMessage:
     content: str  # Message text
     media: Optional[list] = None  # Media attachments
     metadata: Optional[dict] = None  # Extra channel-specific data
+    # Unique session key for this chat, computed once in __post_init__
+    session_key: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def session_key(self) -> str:
-        """Generate unique session key for this chat."""
-        return f"{self.channel}:{self.chat_id}"
+    def __post_init__(self) -> None:
+        self.session_key = f"{self.channel}:{self.chat_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundMessage:
     """Message to be sent to a channel."""
 
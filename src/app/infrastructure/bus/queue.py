@@ -2,23 +2,75 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Optional, TypeVar
 
 from app.infrastructure.bus.events import InboundMessage, OutboundMessage
 
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+def _put_drop_oldest(queue: asyncio.Queue[_T], item: _T) -> Optional[_T]:
+    """Put without waiting, evicting the oldest item if the queue is full.
+
+    Args:
+        queue: Bounded queue to put into
+        item: Item to enqueue
+
+    Returns:
+        The evicted item, or None if there was room
+    """
+    oldest = None
+    if queue.full():
+        oldest = queue.get_nowait()
+        queue.task_done()
+    queue.put_nowait(item)
+    return oldest
+
 
 class MessageBus:
     """Async message bus for decoupling channels from agent."""
 
-    def __init__(self):
-        """Initialize message bus with inbound and outbound queues."""
-        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
-        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
+    def __init__(self, inbound_max: int = 1000, outbound_max: int = 1000):
+        """Initialize message bus with bounded inbound and outbound queues.
+
+        Inbound publishers wait when the queue is full, which applies
+        backpressure to channels. Outbound queues drop their oldest reply
+        instead, so one stalled channel cannot block the agent.
+
+        Args:
+            inbound_max: Maximum number of queued inbound messages
+            outbound_max: Maximum number of queued outbound messages per channel
+        """
+        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue(
+            maxsize=inbound_max
+        )
+        # One outbound queue per channel name, created on first use
+        self.outbound: dict[str, asyncio.Queue[OutboundMessage]] = {}
+        self._outbound_max = outbound_max
         self._running = False
 
+    def register_outbound_channel(self, name: str) -> asyncio.Queue[OutboundMessage]:
+        """Get or create the outbound queue for a channel.
+
+        Channels should register in start() so replies published before their
+        consumer loop first runs are not dropped.
+
+        Args:
+            name: Channel name (matches OutboundMessage.channel)
+
+        Returns:
+            The channel's outbound queue
+        """
+        queue = self.outbound.get(name)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=self._outbound_max)
+            self.outbound[name] = queue
+            logger.debug("Registered outbound channel %s", name)
+        return queue
+
     async def publish_inbound(self, msg: InboundMessage) -> None:
         """Publish message to inbound queue (channel -> agent).
 
@@ -26,7 +78,30 @@ class MessageBus:
             msg: Inbound message
         """
         await self.inbound.put(msg)
-        logger.debug(f"Published inbound message from {msg.channel}:{msg.sender_id}")
+        logger.debug(
+            "Published inbound message from %s:%s", msg.channel, msg.sender_id
+        )
+
+    def try_publish_inbound(self, msg: InboundMessage) -> bool:
+        """Publish without waiting, dropping the oldest message when full.
+
+        Args:
+            msg: Inbound message
+
+        Returns:
+            True if queued without dropping, False if an older message was
+            discarded to make room
+        """
+        oldest = _put_drop_oldest(self.inbound, msg)
+        if oldest is not None:
+            logger.warning(
+                f"Inbound queue full, dropped message from "
+                f"{oldest.channel}:{oldest.sender_id}"
+            )
+        logger.debug(
+            "Published inbound message from %s:%s", msg.channel, msg.sender_id
+        )
+        return oldest is None
 
     async def consume_inbound(self) -> InboundMessage:
         """Consume message from inbound queue.
@@ -39,22 +114,43 @@ class MessageBus:
         return msg
 
     async def publish_outbound(self, msg: OutboundMessage) -> None:
-        """Publish message to outbound queue (agent -> channel).
+        """Publish message to its channel's outbound queue (agent -> channel).
+
+        Never waits, since the agent loop publishes inline and one missing or
+        slow channel must not stall replies to the others. The queue is
+        created on first use if the channel has not registered yet, and when
+        it is full the oldest reply is dropped to make room.
 
         Args:
             msg: Outbound message
         """
-        await self.outbound.put(msg)
-        logger.debug(f"Published outbound message to {msg.channel}:{msg.chat_id}")
+        queue = self.outbound.get(msg.channel)
+        if queue is None:
+            logger.warning(
+                f"No outbound consumer registered for channel {msg.channel}, "
+                f"queueing until it starts"
+            )
+            queue = self.register_outbound_channel(msg.channel)
+        oldest = _put_drop_oldest(queue, msg)
+        if oldest is not None:
+            logger.warning(
+                f"Outbound queue for {msg.channel} full, dropped reply to "
+                f"{oldest.chat_id}"
+            )
+        logger.debug("Published outbound message to %s:%s", msg.channel, msg.chat_id)
+
+    async def consume_outbound(self, channel: str) -> OutboundMessage:
+        """Consume the next outbound message for a channel.
 
-    async def consume_outbound(self) -> OutboundMessage:
-        """Consume message from outbound queue.
+        Args:
+            channel: Channel name to consume for
 
         Returns:
             Outbound message
         """
-        msg = await self.outbound.get()
-        self.outbound.task_done()
+        queue = self.register_outbound_channel(channel)
+        msg = await queue.get()
+        queue.task_done()
         return msg
 
     def start(self) -> None:
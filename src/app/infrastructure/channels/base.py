@@ -1,7 +1,7 @@
 """Base channel interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Container, Optional
 
 from app.infrastructure.bus.events import InboundMessage, OutboundMessage
 
@@ -39,13 +39,14 @@ class BaseChannel(ABC):
         return None
 
     def is_allowed(
-        self, sender_id: str, allow_list: Optional[list[str]] = None
+        self, sender_id: str, allow_list: Optional[Container[str]] = None
     ) -> bool:
         """Check if sender is allowed to interact.
 
         Args:
             sender_id: Sender identifier
-            allow_list: Optional list of allowed sender IDs
+            allow_list: Optional collection of allowed sender IDs (a set gives
+                O(1) membership checks)
 
         Returns:
             True if allowed, False otherwise
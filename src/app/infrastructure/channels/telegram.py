@@ -41,15 +41,26 @@ class TelegramChannel(BaseChannel):
         """
         self.token = token
         self.bus = bus
-        self.allow_list = allow_list
+        # Checked on every update, so keep it as a set for O(1) lookups
+        self.allow_list = frozenset(allow_list) if allow_list else None
         self.application: Optional[Application] = None
         self._running = False
 
     async def start(self) -> None:
         """Start Telegram bot polling and outbound consumer."""
         try:
-            # Build application
-            self.application = Application.builder().token(self.token).build()
+            # Subscribe before polling so early replies have somewhere to go
+            self.bus.register_outbound_channel(self.name)
+
+            # Build application once; its HTTP client is pooled and reused for
+            # every send, so lift the default pool cap for chunked replies
+            self.application = (
+                Application.builder()
+                .token(self.token)
+                .connection_pool_size(32)
+                .pool_timeout(30)
+                .build()
+            )
 
             # Add handlers
             self.application.add_handler(CommandHandler("start", self._handle_start))
@@ -79,10 +90,8 @@ class TelegramChannel(BaseChannel):
         logger.info("Telegram outbound consumer started")
         while self._running:
             try:
-                msg = await self.bus.consume_outbound()
-                # Only handle messages for this channel
-                if msg.channel == "telegram":
-                    await self.send(msg)
+                msg = await self.bus.consume_outbound(self.name)
+                await self.send(msg)
             except Exception as e:
                 logger.error(f"Error in Telegram outbound loop: {e}")
                 await asyncio.sleep(1)
@@ -113,21 +122,18 @@ class TelegramChannel(BaseChannel):
             return
 
         try:
-            # Split long messages
+            # Split long messages by index so the remainder is never recopied
             max_length = 4096
             content = msg.content
 
-            while content:
-                chunk = content[:max_length]
-                content = content[max_length:]
-
+            for start in range(0, len(content), max_length):
                 await self.application.bot.send_message(
                     chat_id=msg.chat_id,
-                    text=chunk,
+                    text=content[start : start + max_length],
                     parse_mode=None,  # Plain text to avoid parsing errors
                 )
 
-            logger.debug(f"Sent message to Telegram chat {msg.chat_id}")
+            logger.debug("Sent message to Telegram chat %s", msg.chat_id)
 
         except Exception as e:
             logger.error(f"Error sending Telegram message: {e}")
@@ -230,7 +236,7 @@ class TelegramChannel(BaseChannel):
 
             # Publish to bus
             await self.bus.publish_inbound(msg)
-            logger.info(f"Received message from Telegram user {user.id}")
+            logger.info("Received message from Telegram user %s", user.id)
 
         except Exception as e:
             logger.error(f"Error handling Telegram message: {e}")
@@ -1,16 +1,47 @@
 """Cron tool for scheduled reminders and tasks."""
 
-import json
+import asyncio
+import heapq
 import logging
+import os
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from app.infrastructure import jsonio
+from app.infrastructure.fileio import atomic_write_bytes
+
 
 logger = logging.getLogger(__name__)
 
+# Job log size that triggers a compacting rewrite
+_COMPACT_BYTES = 1 << 20
+
+
+# Days searched ahead for a cron match; covers a leap-day expression
+_CRON_SEARCH_DAYS = 4 * 366
+
+
+def _parse_cron(expr: str) -> Optional[tuple[Optional[int], ...]]:
+    """Parse a five-field cron expression.
+
+    Args:
+        expr: Cron expression (minute hour day month weekday)
+
+    Returns:
+        Tuple with an int per fixed field and None per "*", or None if invalid
+    """
+    parts = expr.split()
+    if len(parts) != 5:
+        return None
+    try:
+        return tuple(None if p == "*" else int(p) for p in parts)
+    except ValueError:
+        return None
+
 
 @dataclass
 class CronJob:
@@ -29,6 +60,30 @@ class CronJob:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     last_run: Optional[str] = None
     run_count: int = 0
+    # Parsed forms of at/last_run so the scheduler never re-parses them
+    _at_dt: Optional[datetime] = field(init=False, repr=False, compare=False)
+    _last_run_dt: Optional[datetime] = field(init=False, repr=False, compare=False)
+    _cron_fields: Optional[tuple[Optional[int], ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Parse ISO timestamps once; raises ValueError for a malformed one."""
+        self._at_dt = datetime.fromisoformat(self.at) if self.at else None
+        self._last_run_dt = (
+            datetime.fromisoformat(self.last_run) if self.last_run else None
+        )
+        self._cron_fields = _parse_cron(self.cron) if self.cron else None
+
+    def mark_run(self, now: datetime) -> None:
+        """Record an execution.
+
+        Args:
+            now: Time the job ran
+        """
+        self.last_run = now.isoformat()
+        self._last_run_dt = now
+        self.run_count += 1
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -67,67 +122,72 @@ class CronJob:
             run_count=data.get("run_count", 0),
         )
 
-    def should_run(self) -> bool:
-        """Check if job should run now."""
-        now = datetime.now()
+    def next_fire_after(self, now: datetime) -> Optional[datetime]:
+        """Compute when this job should next fire.
+
+        Args:
+            now: Reference time
 
+        Returns:
+            Next fire time (may be in the past if overdue), or None if the job
+            will not fire again
+        """
         if self.schedule_type == "once":
-            if not self.at:
-                return False
-            run_time = datetime.fromisoformat(self.at)
-            # Run if we're within 1 minute of the scheduled time and haven't run yet
-            if self.run_count > 0:
-                return False
-            time_diff = (now - run_time).total_seconds()
-            return -60 <= time_diff <= 60
+            run_time = self._at_dt
+            if run_time is None or self.run_count > 0:
+                return None
+            # Skip a one-time job missed by more than a minute (e.g. while down)
+            if (now - run_time).total_seconds() > 60:
+                return None
+            return run_time
 
         elif self.schedule_type == "interval":
             if not self.every:
-                return False
-            if not self.last_run:
-                return True
-            last_run = datetime.fromisoformat(self.last_run)
-            seconds_since = (now - last_run).total_seconds()
-            return seconds_since >= self.every
+                return None
+            if self._last_run_dt is None:
+                return now
+            return self._last_run_dt + timedelta(seconds=self.every)
 
         elif self.schedule_type == "cron":
-            # Simple cron check - check if current minute matches
-            if not self.cron:
-                return False
-            return self._check_cron_match()
+            if self._cron_fields is None:
+                return None
+            return self._next_cron_time(self._cron_fields, now)
 
-        return False
+        return None
 
-    def _check_cron_match(self) -> bool:
-        """Check if current time matches cron expression."""
-        try:
-            # Basic cron parsing (minute hour day month weekday)
-            parts = self.cron.split()
-            if len(parts) != 5:
-                return False
-
-            now = datetime.now()
-            minute, hour, day, month, weekday = parts
-
-            # Check minute
-            if minute != "*" and int(minute) != now.minute:
-                return False
-            # Check hour
-            if hour != "*" and int(hour) != now.hour:
-                return False
-            # Check day
-            if day != "*" and int(day) != now.day:
-                return False
-            # Check month
-            if month != "*" and int(month) != now.month:
-                return False
-            # Check weekday (0-6, Monday=0)
-            if weekday != "*" and int(weekday) != now.weekday():
-                return False
-
-            return True
-        except (ValueError, IndexError):
-            return False
+    @staticmethod
+    def _next_cron_time(
+        fields: tuple[Optional[int], ...], now: datetime
+    ) -> Optional[datetime]:
+        """Find the first minute strictly after now matching the cron fields.
+
+        Args:
+            fields: Parsed cron fields from _parse_cron
+            now: Reference time
+
+        Returns:
+            Matching datetime, or None if none within _CRON_SEARCH_DAYS
+        """
+        minute, hour, day, month, weekday = fields
+        start = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        hours = range(24) if hour is None else (hour,)
+        minutes = range(60) if minute is None else (minute,)
+
+        for offset in range(_CRON_SEARCH_DAYS):
+            d = start.date() + timedelta(days=offset)
+            if day is not None and d.day != day:
+                continue
+            if month is not None and d.month != month:
+                continue
+            if weekday is not None and d.weekday() != weekday:
+                continue
+            for h in hours:
+                for m in minutes:
+                    if 0 <= h < 24 and 0 <= m < 60:
+                        candidate = datetime(d.year, d.month, d.day, h, m)
+                        if candidate >= start:
+                            return candidate
+        return None
 
 
 class CronService:
@@ -137,48 +197,83 @@ class CronService:
         self,
         workspace: Path,
         on_job: Optional[Callable[[str, Optional[str], Optional[str]], None]] = None,
+        flush_interval: float = 5.0,
     ):
         """Initialize cron service.
 
         Args:
             workspace: Path to workspace directory
             on_job: Callback when job fires (message, to, channel)
+            flush_interval: Seconds between writes of changed jobs to disk
         """
         self.workspace = Path(workspace)
-        self.jobs_file = self.workspace / "cron_jobs.json"
+        # Append-only log: one {"op": "upsert"|"delete", ...} object per line
+        self.jobs_file = self.workspace / "cron_jobs.ndjson"
+        self._legacy_jobs_file = self.workspace / "cron_jobs.json"
         self.on_job = on_job
         self.jobs: list[CronJob] = []
+        self._jobs_by_id: dict[str, CronJob] = {}
+        # (next fire epoch, job id); entries for removed jobs are skipped lazily
+        self._heap: list[tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self.flush_interval = flush_interval
+        # job_id -> job dict to upsert, or None to delete; coalesced per flush
+        self._pending: dict[str, Optional[dict]] = {}
+        self._compact_next = False
+        self._log_size = 0
+        self._compact_at = _COMPACT_BYTES
+        # One flush at a time: appends and compactions must never overlap
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def start(self) -> None:
         """Start the cron service."""
-        self._load_jobs()
+        # Set first so jobs added while loading stay queued instead of being
+        # written underneath the replay
         self._running = True
-        import asyncio
-
+        await asyncio.to_thread(self._load_jobs)
+        self._apply_pending()
+        self._jobs_by_id = {job.id: job for job in self.jobs}
+        self._heap = []
+        now = datetime.now()
+        for job in self.jobs:
+            self._schedule(job, now)
         self._task = asyncio.create_task(self._run_loop())
+        self._flush_task = asyncio.create_task(self._flush_loop())
         logger.info(f"Cron service started with {len(self.jobs)} jobs")
 
     async def stop(self) -> None:
         """Stop the cron service."""
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._flush_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        # Repeat for changes made while the previous write was in flight
+        await self._flush()
+        while self._pending:
+            await self._flush()
         logger.info("Cron service stopped")
 
     async def _run_loop(self) -> None:
-        """Main cron loop - checks every minute."""
-        import asyncio
-
+        """Main cron loop - sleeps until the next job is due."""
         while self._running:
             try:
+                self._wakeup.clear()
+                delay = self._heap[0][0] - time.time() if self._heap else None
+                if delay is None or delay > 0:
+                    # add_job sets the event so a sooner job is not missed
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
                 await self._check_jobs()
-                await asyncio.sleep(60)  # Check every minute
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -186,11 +281,29 @@ class CronService:
                 await asyncio.sleep(60)
 
     async def _check_jobs(self) -> None:
-        """Check and execute due jobs."""
-        for job in self.jobs:
-            if job.should_run():
-                logger.info(f"Executing cron job: {job.name}")
-                await self._execute_job(job)
+        """Execute due jobs and reschedule them."""
+        now = datetime.now()
+        due_before = now.timestamp()
+        while self._heap and self._heap[0][0] <= due_before:
+            _, job_id = heapq.heappop(self._heap)
+            job = self._jobs_by_id.get(job_id)
+            if job is None:
+                continue
+            logger.info(f"Executing cron job: {job.name}")
+            await self._execute_job(job)
+            if job.id in self._jobs_by_id:
+                self._schedule(job, now)
+
+    def _schedule(self, job: CronJob, now: datetime) -> None:
+        """Push a job's next fire time onto the heap.
+
+        Args:
+            job: Job to schedule
+            now: Reference time
+        """
+        fire_at = job.next_fire_after(now)
+        if fire_at is not None:
+            heapq.heappush(self._heap, (fire_at.timestamp(), job.id))
 
     async def _execute_job(self, job: CronJob) -> None:
         """Execute a cron job.
@@ -200,8 +313,7 @@ class CronService:
         """
         try:
             # Update job stats
-            job.last_run = datetime.now().isoformat()
-            job.run_count += 1
+            job.mark_run(datetime.now())
 
             # Call callback if provided
             if self.on_job:
@@ -210,9 +322,10 @@ class CronService:
             # Remove one-time jobs after execution
             if job.schedule_type == "once":
                 self.jobs.remove(job)
-
-            # Save updated jobs
-            self._save_jobs()
+                self._jobs_by_id.pop(job.id, None)
+                self._record_delete(job.id)
+            else:
+                self._record_upsert(job)
 
         except Exception as e:
             logger.error(f"Error executing cron job {job.name}: {e}")
@@ -259,7 +372,11 @@ class CronService:
         )
 
         self.jobs.append(job)
-        self._save_jobs()
+        self._jobs_by_id[job.id] = job
+        self._schedule(job, datetime.now())
+        self._wakeup.set()
+        self._record_upsert(job)
+        self._flush_if_stopped()
 
         logger.info(f"Added cron job: {name} ({job.id})")
         return job.id
@@ -276,7 +393,9 @@ class CronService:
         for i, job in enumerate(self.jobs):
             if job.id == job_id:
                 self.jobs.pop(i)
-                self._save_jobs()
+                self._jobs_by_id.pop(job_id, None)
+                self._record_delete(job_id)
+                self._flush_if_stopped()
                 logger.info(f"Removed cron job: {job_id}")
                 return True
         return False
@@ -286,28 +405,190 @@ class CronService:
         return self.jobs.copy()
 
     def _load_jobs(self) -> None:
-        """Load jobs from file."""
-        if not self.jobs_file.exists():
-            self.jobs = []
-            return
+        """Load jobs by replaying the job log.
 
+        Falls back to the old cron_jobs.json snapshot, which is migrated to the
+        log on the next flush.
+        """
+        self._log_size = 0
+        records: list[dict] = []
         try:
-            data = json.loads(self.jobs_file.read_text(encoding="utf-8"))
-            self.jobs = [
-                CronJob.from_dict(job_data) for job_data in data.get("jobs", [])
-            ]
-            logger.debug(f"Loaded {len(self.jobs)} cron jobs")
+            if self.jobs_file.exists():
+                records = self._replay_log()
+            elif self._legacy_jobs_file.exists():
+                data = jsonio.loads(self._legacy_jobs_file.read_bytes())
+                records = data.get("jobs", [])
+                self._compact_next = True
         except Exception as e:
             logger.error(f"Error loading cron jobs: {e}")
-            self.jobs = []
 
-    def _save_jobs(self) -> None:
-        """Save jobs to file."""
+        # Built aside and swapped in at once, since start() runs this in a
+        # worker thread while the event loop may still read self.jobs
+        jobs = []
+        for job_data in records:
+            try:
+                jobs.append(CronJob.from_dict(job_data))
+            except (KeyError, ValueError) as e:
+                logger.error(f"Skipping invalid cron job {job_data!r}: {e}")
+        self.jobs = jobs
+        logger.debug(f"Loaded {len(self.jobs)} cron jobs")
+
+    def _apply_pending(self) -> None:
+        """Apply changes queued before the log was loaded on top of it."""
+        jobs = {job.id: job for job in self.jobs}
+        for job_id, data in self._pending.items():
+            if data is None:
+                jobs.pop(job_id, None)
+            else:
+                jobs[job_id] = CronJob.from_dict(data)
+        self.jobs = list(jobs.values())
+
+    def _replay_log(self) -> list[dict]:
+        """Read the job log and fold it into the current job dicts.
+
+        Returns:
+            Job dicts in insertion order
+        """
+        jobs: dict[str, dict] = {}
+        with open(self.jobs_file, "rb") as f:
+            for line in f:
+                self._log_size += len(line)
+                try:
+                    record = jsonio.loads(line)
+                    if record["op"] == "upsert":
+                        jobs[record["job"]["id"]] = record["job"]
+                    elif record["op"] == "delete":
+                        jobs.pop(record["id"], None)
+                except (ValueError, KeyError, TypeError):
+                    # Likely a torn append; rewrite the log before appending again
+                    logger.warning(f"Skipping corrupt cron log line: {line!r}")
+                    self._compact_next = True
+        return list(jobs.values())
+
+    def _record_upsert(self, job: CronJob) -> None:
+        """Queue a job's current state for the next flush.
+
+        Args:
+            job: Job that was added or updated
+        """
+        self._pending.pop(job.id, None)
+        self._pending[job.id] = job.to_dict()
+
+    def _record_delete(self, job_id: str) -> None:
+        """Queue a job deletion for the next flush.
+
+        Args:
+            job_id: ID of the removed job
+        """
+        self._pending.pop(job_id, None)
+        self._pending[job_id] = None
+
+    async def _flush_loop(self) -> None:
+        """Periodically write changed jobs to disk."""
+        while self._running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self._flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error flushing cron jobs: {e}")
+
+    def _take_pending(self) -> Optional[tuple[bytes, bool]]:
+        """Serialize queued changes, or every job when the log needs compacting.
+
+        Returns:
+            (NDJSON lines, compact) for _save_jobs, or None if nothing to write
+        """
+        compact = self._compact_next or self._log_size >= self._compact_at
+        if not self._pending and not compact:
+            return None
+
+        if compact:
+            records = [{"op": "upsert", "job": job.to_dict()} for job in self.jobs]
+        else:
+            records = [
+                {"op": "upsert", "job": data}
+                if data is not None
+                else {"op": "delete", "id": job_id}
+                for job_id, data in self._pending.items()
+            ]
+        self._pending = {}
+        self._compact_next = False
+        return b"".join(jsonio.dumps(record) + b"\n" for record in records), compact
+
+    def _flush_if_stopped(self) -> None:
+        """Write queued changes right away when no flush loop will do it."""
+        if self._running or self._flush_lock.locked():
+            return
+        batch = self._take_pending()
+        if batch is not None:
+            data, compact = batch
+            self._record_write(compact, self._save_jobs(data, compact))
+
+    async def _flush(self) -> None:
+        """Append queued changes to the job log, compacting it when large."""
+        async with self._flush_lock:
+            # Serialize on the loop so the worker thread never sees mutating jobs
+            batch = self._take_pending()
+            if batch is None:
+                return
+            data, compact = batch
+
+            # Cancelling the flush can't stop the worker thread, so wait for it
+            # before releasing the lock and letting another flush start
+            write = asyncio.create_task(
+                asyncio.to_thread(self._save_jobs, data, compact)
+            )
+            try:
+                written = await asyncio.shield(write)
+            except asyncio.CancelledError:
+                self._record_write(compact, await write)
+                raise
+            self._record_write(compact, written)
+
+    def _save_jobs(self, data: bytes, compact: bool) -> Optional[int]:
+        """Write serialized log lines to the job log.
+
+        Runs in a worker thread, so it only touches the file; the caller
+        updates the size counters on the event loop.
+
+        Args:
+            data: NDJSON lines to write
+            compact: If True, replace the log with data instead of appending
+
+        Returns:
+            Number of bytes written, or None if the write failed
+        """
         try:
-            data = {"jobs": [job.to_dict() for job in self.jobs]}
-            self.jobs_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            if compact:
+                atomic_write_bytes(self.jobs_file, data, fsync=True)
+            else:
+                with open(self.jobs_file, "ab") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+            return len(data)
         except Exception as e:
             logger.error(f"Error saving cron jobs: {e}")
+            return None
+
+    def _record_write(self, compact: bool, written: Optional[int]) -> None:
+        """Update the log size bookkeeping after a _save_jobs call.
+
+        Args:
+            compact: Whether the write replaced the log
+            written: Return value of _save_jobs
+        """
+        if written is None:
+            # The lost records are covered by a full rewrite next time
+            self._compact_next = True
+        elif compact:
+            self._log_size = written
+            # Don't recompact on every flush when there are many jobs
+            self._compact_at = max(_COMPACT_BYTES, 2 * written)
+        else:
+            self._log_size += written
 
     @property
     def is_running(self) -> bool:
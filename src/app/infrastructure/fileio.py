@@ -0,0 +1,57 @@
+"""Atomic file writes and change detection shared by the file-backed stores."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+def stat_key(path: Path) -> Optional[tuple[int, int]]:
+    """Return a file's (mtime_ns, size), or None if it can't be stat'ed.
+
+    The size catches rewrites that land within the filesystem's mtime
+    granularity, which mtime alone would miss.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Write bytes to path atomically via a same-directory temp file.
+
+    Readers see either the old or the new content, never a truncated file.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+        fsync: If True, flush the temp file to disk before replacing
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # Same filesystem, so a single atomic rename
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, text: str, fsync: bool = False) -> None:
+    """Write UTF-8 text to path atomically.
+
+    Args:
+        path: Destination file path
+        text: Text to write
+        fsync: If True, flush the temp file to disk before replacing
+    """
+    atomic_write_bytes(path, text.encode("utf-8"), fsync=fsync)
@@ -5,6 +5,8 @@ Checks HEARTBEAT.md every 30 minutes for recurring tasks.
 
 import asyncio
 import logging
+import os
+import re
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -18,6 +20,9 @@ Follow any instructions or tasks listed there.
 If nothing needs attention, reply with just: HEARTBEAT_OK"""
 HEARTBEAT_OK_TOKEN = "HEARTBEAT_OK"
 
+# A line whose first non-blank text is not a header (#) or comment (<!-- / -->)
+_ACTIONABLE_RE = re.compile(rb"^[ \t\r\f\v]*(?!<!--|-->)[^#\s]", re.MULTILINE)
+
 
 class HeartbeatService:
     """Service to periodically check HEARTBEAT.md for tasks."""
@@ -44,6 +49,9 @@ class HeartbeatService:
         self.enabled = enabled
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        # (mtime_ns, size) of HEARTBEAT.md at the last read, and its verdict
+        self._last_stat: Optional[tuple[int, int]] = None
+        self._last_actionable = False
 
     async def start(self) -> None:
         """Start the heartbeat service."""
@@ -80,15 +88,14 @@ class HeartbeatService:
 
     async def _check_heartbeat(self) -> None:
         """Check HEARTBEAT.md and execute if needed."""
-        if not self.heartbeat_file.exists():
-            logger.debug("HEARTBEAT.md not found, skipping")
-            return
-
         try:
-            content = self.heartbeat_file.read_text(encoding="utf-8")
+            actionable = await asyncio.to_thread(self._read_actionable)
+            if actionable is None:
+                logger.debug("HEARTBEAT.md not found, skipping")
+                return
 
             # Check if file has actionable content (skip empty, headers only, comments)
-            if not self._has_actionable_content(content):
+            if not actionable:
                 logger.debug("HEARTBEAT.md has no actionable content")
                 return
 
@@ -107,35 +114,41 @@ class HeartbeatService:
         except Exception as e:
             logger.error(f"Error checking heartbeat: {e}")
 
-    def _has_actionable_content(self, content: str) -> bool:
+    def _read_actionable(self) -> Optional[bool]:
+        """Stat HEARTBEAT.md and re-read it only if it changed since last time.
+
+        Runs in a worker thread so neither the stat nor the read blocks the
+        event loop.
+
+        Returns:
+            Whether the file has actionable content, or None if it is missing
+        """
+        try:
+            st = os.stat(self.heartbeat_file)
+        except FileNotFoundError:
+            return None
+
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._last_stat:
+            content = self.heartbeat_file.read_bytes()
+            self._last_actionable = self._has_actionable_content(content)
+            self._last_stat = key
+        return self._last_actionable
+
+    def _has_actionable_content(self, content: bytes) -> bool:
         """Check if heartbeat file has actionable tasks.
 
+        Empty lines, headers and comment markers are skipped; any other line
+        (task markers included) is actionable. The regex stops at the first
+        such line, so the file is never decoded or split.
+
         Args:
-            content: File content
+            content: Raw file content
 
         Returns:
             True if there are actionable tasks
         """
-        lines = content.strip().split("\n")
-
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines, headers, comments
-            if not line:
-                continue
-            if line.startswith("#"):
-                continue
-            if line.startswith("<!--"):
-                continue
-            if line.startswith("-->"):
-                continue
-            # Check for task markers
-            if line.startswith("- [ ]") or line.startswith("- [x]"):
-                return True
-            # Any non-header content is actionable
-            return True
-
-        return False
+        return _ACTIONABLE_RE.search(content) is not None
 
     def trigger_now(self) -> None:
         """Manually trigger a heartbeat check."""
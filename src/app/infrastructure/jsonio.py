@@ -0,0 +1,43 @@
+"""JSON encoding shared by the file-backed stores and the agent loop.
+
+Uses orjson when it is installed (``pip install nova-api[fast-json]``) and
+falls back to the stdlib json module otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-compatible value
+        indent: If True, pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def loads(raw: str | bytes) -> Any:
+    """Parse a JSON string or bytes payload.
+
+    Raises:
+        ValueError: If raw is not valid JSON (both backends subclass it)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -1,20 +1,39 @@
 """Memory consolidation logic for archiving old messages."""
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import json_repair
 
+from app.infrastructure import jsonio
 from app.infrastructure.memory.store import MemoryStore
 from app.infrastructure.memory.models import MemorySummary
 from app.infrastructure.session.manager import Session
+from app.infrastructure.session.models import Message
 from app.domain.ports.llm_client_port import LLMClientPort
 
 
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_response(text: str) -> Any:
+    """Parse the LLM's JSON reply, repairing it only if strict parsing fails."""
+    try:
+        return jsonio.loads(text)
+    except ValueError:
+        return json_repair.loads(text)
+
+
+def _format_message(msg: Message) -> str:
+    """Render one session message as a transcript line."""
+    timestamp = msg.timestamp.isoformat()[:16]
+    tools = f" [tools: {', '.join(msg.tools_used)}]" if msg.tools_used else ""
+    return f"[{timestamp}] {msg.role.upper()}{tools}: {msg.content}"
+
+
 class MemoryConsolidator:
     """Consolidates old session messages into memory."""
 
@@ -74,25 +93,11 @@ class MemoryConsolidator:
                 f"Consolidating {len(old_messages)} messages for session {session.key}"
             )
 
-        # Format conversation
-        lines = []
-        for msg in old_messages:
-            if not msg.get("content"):
-                continue
-
-            role = msg.get("role", "unknown")
-            timestamp = msg.get("timestamp", "?")[:16]
-            tools = (
-                f" [tools: {', '.join(msg['tools_used'])}]"
-                if msg.get("tools_used")
-                else ""
-            )
-            content = msg.get("content", "")
-
-            lines.append(f"[{timestamp}] {role.upper()}{tools}: {content}")
-
-        conversation = "\n".join(lines)
-        current_memory = self.memory_store.read_long_term()
+        # Format conversation in one pass, without an intermediate list
+        conversation = "\n".join(
+            _format_message(msg) for msg in old_messages if msg.content
+        )
+        current_memory = await asyncio.to_thread(self.memory_store.read_long_term)
 
         # Build prompt for LLM
         prompt = f"""You are a memory consolidation agent. Process this conversation and return a JSON object with exactly two keys:
@@ -131,19 +136,21 @@ Respond with ONLY valid JSON, no markdown fences."""
                 text = text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
 
             # Parse JSON
-            result = json_repair.loads(text)
+            result = _parse_response(text)
             if not isinstance(result, dict):
                 logger.warning("Memory consolidation: unexpected response type")
                 return
 
             # Update history
             if entry := result.get("history_entry"):
-                self.memory_store.append_history(entry)
+                await asyncio.to_thread(self.memory_store.append_history, entry)
 
             # Update memory
             if update := result.get("memory_update"):
                 if update != current_memory:
-                    self.memory_store.write_long_term(update)
+                    await asyncio.to_thread(
+                        self.memory_store.write_long_term, update
+                    )
 
             # Update session tracking
             if archive_all:
@@ -166,7 +173,7 @@ Respond with ONLY valid JSON, no markdown fences."""
                 # Extract key topics from conversation
                 topics = []
                 for msg in old_messages:
-                    content = msg.get("content", "")
+                    content = msg.content
                     # Simple extraction of potential topics
                     if any(
                         word in content.lower()
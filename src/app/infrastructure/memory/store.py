@@ -6,13 +6,22 @@ Two-layer memory system:
 """
 
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from app.infrastructure.fileio import atomic_write_text, stat_key
+
 
 logger = logging.getLogger(__name__)
 
+# Start of a HISTORY.md entry header, as written by append_history
+_ENTRY_MARKER = "\n## ["
+
+# "## Name" section header line in MEMORY.md; split() keeps the captured name
+_SECTION_RE = re.compile(r"^## (.*)$", re.MULTILINE)
+
 
 class MemoryStore:
     """Two-layer memory storage using markdown files."""
@@ -28,6 +37,11 @@ class MemoryStore:
         self.memory_file = self.memory_dir / "MEMORY.md"
         self.history_file = self.memory_dir / "HISTORY.md"
 
+        # Parsed MEMORY.md as _SECTION_RE.split() output, valid while the file's
+        # (mtime_ns, size) still equals _sections_key
+        self._sections: Optional[list[str]] = None
+        self._sections_key: Optional[tuple[int, int]] = None
+
         # Ensure directories exist
         self._ensure_directories()
 
@@ -37,20 +51,31 @@ class MemoryStore:
 
         # Create empty files if they don't exist
         if not self.memory_file.exists():
-            self.memory_file.write_text(
+            atomic_write_text(
+                self.memory_file,
                 "# Long-term Memory\n\n"
                 "This file contains long-term facts and preferences.\n\n"
                 "## User Information\n\n"
                 "## Preferences\n\n"
-                "## Projects\n\n"
+                "## Projects\n\n",
             )
 
         if not self.history_file.exists():
-            self.history_file.write_text(
+            atomic_write_text(
+                self.history_file,
                 "# Conversation History\n\n"
-                "This file contains a searchable archive of past conversations.\n\n"
+                "This file contains a searchable archive of past conversations.\n\n",
             )
 
+    @property
+    def stat_key(self) -> Optional[tuple[int, int]]:
+        """MEMORY.md's (mtime_ns, size), or None if it can't be stat'ed.
+
+        Lets callers that cache memory-derived content detect changes with a
+        single stat call.
+        """
+        return stat_key(self.memory_file)
+
     def read_long_term(self) -> str:
         """Read long-term memory (MEMORY.md).
 
@@ -69,12 +94,36 @@ class MemoryStore:
         Args:
             content: New content for MEMORY.md
         """
+        self._write_memory(content)
+
+    def _write_memory(self, content: str, sections: Optional[list[str]] = None) -> None:
+        """Write MEMORY.md and remember its parsed sections.
+
+        Args:
+            content: New content for MEMORY.md
+            sections: content already split by _SECTION_RE, if known
+        """
         try:
-            self.memory_file.write_text(content, encoding="utf-8")
+            atomic_write_text(self.memory_file, content, fsync=True)
+            self._sections = sections
+            self._sections_key = self.stat_key if sections is not None else None
             logger.info("Updated long-term memory")
         except Exception as e:
             logger.error(f"Error writing memory file: {e}")
 
+    def _load_sections(self) -> list[str]:
+        """Return MEMORY.md split into sections, re-parsing only if it changed.
+
+        Returns:
+            [preamble, name1, body1, name2, body2, ...]; each body starts with
+            the newline ending its header line
+        """
+        key = self.stat_key
+        if self._sections is None or key is None or key != self._sections_key:
+            self._sections = _SECTION_RE.split(self.read_long_term())
+            self._sections_key = key
+        return self._sections
+
     def append_history(self, entry: str) -> None:
         """Append entry to history (HISTORY.md).
 
@@ -102,37 +151,38 @@ class MemoryStore:
             List of matching history entries
         """
         try:
-            content = self.history_file.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            matches = []
-            current_entry = []
-            in_entry = False
-
-            for line in lines:
-                if line.startswith("## ["):
-                    # Start of new entry
-                    if in_entry and current_entry:
-                        entry_text = "\n".join(current_entry)
-                        if query.lower() in entry_text.lower():
-                            matches.append(entry_text)
-                    current_entry = [line]
-                    in_entry = True
-                elif in_entry:
-                    current_entry.append(line)
-
-            # Don't forget the last entry
-            if in_entry and current_entry:
-                entry_text = "\n".join(current_entry)
-                if query.lower() in entry_text.lower():
-                    matches.append(entry_text)
-
-            return matches
-
+            # Leading newline so an entry at offset 0 matches the same marker
+            content = "\n" + self.history_file.read_text(encoding="utf-8")
         except Exception as e:
             logger.error(f"Error searching history: {e}")
             return []
 
+        # Scan the whole file in C and only visit entries that contain a hit,
+        # instead of splitting it into lines and lowercasing every entry
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        matches = []
+        # Entries start just after the newline of their marker
+        pos = content.find(_ENTRY_MARKER) + 1
+        while pos > 0:
+            hit = pattern.search(content, pos)
+            if hit is None:
+                break
+            # Entry containing the hit: from the last marker before it
+            start = content.rfind(
+                _ENTRY_MARKER, 0, hit.start() + len(_ENTRY_MARKER) - 1
+            )
+            end = content.find(_ENTRY_MARKER, start + 1)
+            if end == -1:
+                end = len(content)
+            if hit.end() <= end:
+                matches.append(content[start + 1 : end])
+                pos = end + 1 if end < len(content) else 0
+            else:
+                # Hit straddles two entries, so it matches neither
+                pos = hit.start() + 1
+
+        return matches
+
     def update_section(self, section: str, content: str) -> None:
         """Update a specific section in MEMORY.md.
 
@@ -141,23 +191,29 @@ class MemoryStore:
             content: New content for the section
         """
         try:
-            current = self.read_long_term()
-
-            # Find section
-            section_header = f"## {section}"
-            if section_header not in current:
+            sections = list(self._load_sections())
+            body = f"\n\n{content}\n"
+
+            try:
+                # Names sit at odd indexes, each followed by its body
+                index = sections.index(section, 1)
+                while index % 2 == 0:
+                    index = sections.index(section, index + 1)
+            except ValueError:
                 # Add section if it doesn't exist
-                current += f"\n## {section}\n\n{content}\n"
+                sections[-1] += "\n"
+                sections += [section, body]
             else:
-                # Replace section content
-                parts = current.split(section_header)
-                if len(parts) == 2:
-                    before = parts[0]
-                    after_parts = parts[1].split("\n## ", 1)
-                    after = "\n## " + after_parts[1] if len(after_parts) > 1 else ""
-                    current = before + section_header + "\n\n" + content + "\n" + after
-
-            self.write_long_term(current)
+                # Replace section content, keeping a blank line before the next
+                is_last = index == len(sections) - 2
+                sections[index + 1] = body if is_last else body + "\n"
+
+            current = "".join(
+                part if i % 2 == 0 else f"## {part}" for i, part in enumerate(sections)
+            )
+            # Cache the re-parsed text, not the edited list: content may itself
+            # contain "## " lines that form sections of their own
+            self._write_memory(current, _SECTION_RE.split(current))
 
         except Exception as e:
             logger.error(f"Error updating section: {e}")
@@ -1,11 +1,13 @@
 """Session management for conversation persistence with Pydantic validation."""
 
-import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from app.infrastructure import jsonio
+from app.infrastructure.fileio import atomic_write_bytes
 from app.infrastructure.session.models import Session
 
 
@@ -30,6 +32,9 @@ class SessionManager:
         # In-memory cache
         self._cache: dict[str, Session] = {}
 
+        # Keys of cached sessions waiting for snapshot_dirty()
+        self._dirty: set[str] = set()
+
     def _get_session_path(self, key: str) -> Path:
         """Get file path for session.
 
@@ -60,7 +65,7 @@ class SessionManager:
         session_path = self._get_session_path(key)
         if session_path.exists():
             try:
-                data = json.loads(session_path.read_text(encoding="utf-8"))
+                data = jsonio.loads(session_path.read_bytes())
                 session = Session.from_dict(data)
                 self._cache[key] = session
                 logger.info(f"Loaded session: {key}")
@@ -80,16 +85,69 @@ class SessionManager:
         Args:
             session: Session to save
         """
+        self._write(session.key, self._serialize(session))
+
+    def _serialize(self, session: Session) -> bytes:
+        """Stamp updated_at and serialize a session to JSON bytes."""
+        session.updated_at = datetime.now()
+        return jsonio.dumps(session.to_dict(), indent=True)
+
+    def _write(self, key: str, data: bytes) -> None:
+        """Write serialized session bytes to the session's file.
+
+        Args:
+            key: Session key
+            data: Output of _serialize()
+        """
         try:
-            session_path = self._get_session_path(session.key)
-            session.updated_at = datetime.now()
-            session_path.write_text(
-                json.dumps(session.to_dict(), indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            logger.debug(f"Saved session: {session.key}")
+            atomic_write_bytes(self._get_session_path(key), data)
+            logger.debug(f"Saved session: {key}")
         except Exception as e:
-            logger.error(f"Error saving session {session.key}: {e}")
+            logger.error(f"Error saving session {key}: {e}")
+
+    def save_later(self, session: Session) -> None:
+        """Mark a session to be written by the next snapshot_dirty() call.
+
+        Args:
+            session: Session to save
+        """
+        self._cache[session.key] = session
+        self._dirty.add(session.key)
+
+    def snapshot_dirty(self) -> list[tuple[str, bytes]]:
+        """Serialize every session marked with save_later() and clear the marks.
+
+        Call this on the thread that mutates sessions (the event loop), then
+        hand the result to write_snapshots(), which is safe to run elsewhere.
+
+        Returns:
+            (session key, JSON bytes) pairs
+        """
+        dirty, self._dirty = self._dirty, set()
+        snapshots = []
+        for key in dirty:
+            session = self._cache.get(key)
+            if session is not None:
+                try:
+                    snapshots.append((key, self._serialize(session)))
+                except Exception as e:
+                    logger.error(f"Error serializing session {key}: {e}")
+        return snapshots
+
+    def write_snapshots(self, snapshots: list[tuple[str, bytes]]) -> int:
+        """Write sessions serialized by snapshot_dirty().
+
+        Args:
+            snapshots: (session key, JSON bytes) pairs
+
+        Returns:
+            Number of sessions written
+        """
+        for key, data in snapshots:
+            self._write(key, data)
+        if snapshots:
+            logger.debug(f"Flushed {len(snapshots)} dirty sessions")
+        return len(snapshots)
 
     def invalidate(self, key: str) -> None:
         """Remove session from cache.
@@ -97,6 +155,7 @@ class SessionManager:
         Args:
             key: Session key
         """
+        self._dirty.discard(key)
         if key in self._cache:
             del self._cache[key]
             logger.debug(f"Invalidated session from cache: {key}")
@@ -107,11 +166,13 @@ class SessionManager:
         Returns:
             List of session keys
         """
-        sessions: list[str] = []
-        for session_file in self.sessions_dir.glob("*.json"):
-            key = session_file.stem.replace("_", ":", 1)
-            sessions.append(key)
-        return sessions
+        # scandir reuses the DirEntry metadata, so filtering costs no extra stat
+        with os.scandir(self.sessions_dir) as entries:
+            return [
+                entry.name[:-5].replace("_", ":", 1)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
 
     def delete_session(self, key: str) -> bool:
         """Delete a session.
@@ -127,6 +188,7 @@ class SessionManager:
             if session_path.exists():
                 session_path.unlink()
 
+            self._dirty.discard(key)
             if key in self._cache:
                 del self._cache[key]
 
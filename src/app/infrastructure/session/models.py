@@ -55,9 +55,12 @@ class Session(BaseModel):
             content: Message content
             tools_used: Optional list of tools used
         """
-        message = Message(role=role, content=content, tools_used=tools_used)
+        now = datetime.now()
+        message = Message(
+            role=role, content=content, timestamp=now, tools_used=tools_used
+        )
         self.messages.append(message)
-        self.updated_at = datetime.now()
+        self.updated_at = now
 
     def get_history(self, max_messages: Optional[int] = None) -> List[dict]:
         """Get conversation history as list of dicts.
@@ -4,28 +4,40 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from app.infrastructure.fileio import stat_key
 from app.infrastructure.memory.store import MemoryStore
 from app.infrastructure.skills.loader import SkillsLoader, Skill
 
 
 logger = logging.getLogger(__name__)
 
+BOOTSTRAP_FILES = ("SOUL.md", "AGENTS.md", "USER.md", "TOOLS.md")
+
 
 class ContextBuilder:
     """Builds prompts with bootstrap files, memory, and skills."""
 
-    def __init__(self, workspace: Path, skills_loader: Optional[SkillsLoader] = None):
+    def __init__(
+        self,
+        workspace: Path,
+        skills_loader: Optional[SkillsLoader] = None,
+        memory_store: Optional[MemoryStore] = None,
+    ):
         """Initialize context builder.
 
         Args:
             workspace: Path to workspace directory
             skills_loader: Optional SkillsLoader instance. If not provided, creates a new one.
+            memory_store: Optional MemoryStore instance. If not provided, creates a new one.
         """
         self.workspace = Path(workspace)
-        self.memory_store = MemoryStore(workspace)
+        self.memory_store = memory_store or MemoryStore(workspace)
         self.skills_loader = skills_loader or SkillsLoader(workspace)
         self.bootstrap_dir = self.workspace  # Bootstrap files are in workspace root
 
+        # Last built prompt, keyed on the stats of the files it was built from
+        self._prompt_cache: Optional[tuple[tuple, str]] = None
+
     def _load_bootstrap_file(self, filename: str) -> str:
         """Load a bootstrap file if it exists.
 
@@ -83,6 +95,24 @@ class ContextBuilder:
 
         return "\n".join(parts)
 
+    def _prompt_fingerprint(self, include_memory: bool, include_skills: bool) -> tuple:
+        """Fingerprint the inputs of the system prompt using file stats.
+
+        Args:
+            include_memory: Whether memory is part of the prompt
+            include_skills: Whether skills are part of the prompt
+
+        Returns:
+            Tuple that changes whenever any prompt source file changes
+        """
+        return (
+            include_memory,
+            include_skills,
+            tuple(stat_key(self.bootstrap_dir / name) for name in BOOTSTRAP_FILES),
+            self.memory_store.stat_key if include_memory else None,
+            self.skills_loader.version if include_skills else None,
+        )
+
     def build_system_prompt(
         self,
         include_memory: bool = True,
@@ -90,6 +120,31 @@ class ContextBuilder:
     ) -> str:
         """Build the system prompt with bootstrap, memory, and skills.
 
+        The result is reused until one of the bootstrap files or MEMORY.md
+        changes on disk, or the skills loader reloads its skills.
+
+        Args:
+            include_memory: Whether to include long-term memory
+            include_skills: Whether to include skills
+
+        Returns:
+            Complete system prompt
+        """
+        if include_skills:
+            # Load (or hit the loader cache) first so the version is current
+            self.skills_loader.load_all()
+
+        fingerprint = self._prompt_fingerprint(include_memory, include_skills)
+        if self._prompt_cache is not None and self._prompt_cache[0] == fingerprint:
+            return self._prompt_cache[1]
+
+        prompt = self._build_system_prompt(include_memory, include_skills)
+        self._prompt_cache = (fingerprint, prompt)
+        return prompt
+
+    def _build_system_prompt(self, include_memory: bool, include_skills: bool) -> str:
+        """Assemble the system prompt from disk without caching.
+
         Args:
             include_memory: Whether to include long-term memory
             include_skills: Whether to include skills
@@ -1,6 +1,7 @@
 """Skills loader for markdown-based skills with YAML frontmatter and Pydantic validation."""
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -29,6 +30,9 @@ class SkillsLoader:
         # Cache for loaded skills
         self._cached_skills: Optional[list[Skill]] = None
 
+        # Incremented every time skills are (re)loaded from disk
+        self.version = 0
+
         # Ensure directories exist
         self._ensure_directories()
 
@@ -145,12 +149,13 @@ class SkillsLoader:
 
         if not self.user_path.exists():
             self._cached_skills = skills
+            self.version += 1
             return skills
 
-        for skill_dir in self.user_path.iterdir():
-            if not skill_dir.is_dir():
-                continue
+        with os.scandir(self.user_path) as entries:
+            skill_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
 
+        for skill_dir in skill_dirs:
             # Look for SKILL.md
             skill_file = skill_dir / "SKILL.md"
             if skill_file.exists():
@@ -161,6 +166,7 @@ class SkillsLoader:
 
         logger.info(f"Loaded {len(skills)} skills")
         self._cached_skills = skills
+        self.version += 1
         return skills
 
     def get_skill(self, name: str) -> Optional[Skill]:
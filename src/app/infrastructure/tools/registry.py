@@ -1,5 +1,6 @@
 """Tool Registry for managing and executing tools with Pydantic AI validation."""
 
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -25,6 +26,7 @@ class ToolRegistry:
         self,
         enable_validation: bool = False,  # Disabled by default - tools return strings
         async_validation: bool = True,
+        max_concurrent_tools: int = 8,
     ):
         """Initialize registry.
 
@@ -33,11 +35,16 @@ class ToolRegistry:
                               Note: Tools return strings, not structured data, so
                               validation is disabled by default.
             async_validation: Whether to use async validation
+            max_concurrent_tools: Maximum number of tools executing at once
         """
         self._tools: dict[str, Tool] = {}
+        self._definitions_cache: Optional[list[dict[str, Any]]] = None
         self.enable_validation = enable_validation
         self.async_validation = async_validation
 
+        # Caps fan-out when a single LLM turn requests many tools at once
+        self._semaphore = asyncio.Semaphore(max_concurrent_tools)
+
         # Map tool names to their result validators
         # Note: These validators expect structured data (dict/Pydantic model),
         # but tools currently return strings. Validation is disabled by default.
@@ -59,6 +66,7 @@ class ToolRegistry:
             tool: Tool instance to register
         """
         self._tools[tool.name] = tool
+        self._definitions_cache = None
         logger.debug(f"Registered tool: {tool.name}")
 
     def get(self, name: str) -> Tool | None:
@@ -83,10 +91,17 @@ class ToolRegistry:
     def get_definitions(self) -> list[dict[str, Any]]:
         """Get OpenAI function definitions for all tools.
 
+        The list is built once and reused until another tool is registered,
+        so callers must treat it as read-only.
+
         Returns:
             List of tool schemas in OpenAI format
         """
-        return [tool.to_schema() for tool in self._tools.values()]
+        if self._definitions_cache is None:
+            self._definitions_cache = [
+                tool.to_schema() for tool in self._tools.values()
+            ]
+        return self._definitions_cache
 
     async def execute(
         self,
@@ -95,6 +110,26 @@ class ToolRegistry:
     ) -> str:
         """Execute a tool by name with optional result validation.
 
+        At most max_concurrent_tools executions run at the same time; extra
+        calls wait for a free slot.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tool execution result as string (validated or raw)
+        """
+        async with self._semaphore:
+            return await self._execute(name, arguments)
+
+    async def _execute(
+        self,
+        name: str,
+        arguments: dict[str, Any],
+    ) -> str:
+        """Execute a tool without concurrency limiting.
+
         Args:
             name: Tool name
             arguments: Tool arguments
@@ -117,7 +152,7 @@ class ToolRegistry:
 
         # Execute tool
         try:
-            logger.info(f"Executing tool: {name} with args: {arguments}")
+            logger.info("Executing tool: %s with args: %r", name, arguments)
             raw_result = await tool.execute(**arguments)
 
             # Validate result if validator available and validation is enabled
@@ -131,7 +166,7 @@ class ToolRegistry:
                         None
                     )  # No LLM needed for tool results
                     try:
-                        logger.debug(f"[Tool Registry] Validating result for {name}")
+                        logger.debug("[Tool Registry] Validating result for %s", name)
 
                         # Try to parse raw_result as structured data
                         try:
@@ -161,10 +196,10 @@ class ToolRegistry:
                         logger.warning(
                             f"Validator error for {name}: {e}. Using raw result."
                         )
-                        logger.info(f"Tool {name} executed successfully")
+                        logger.info("Tool %s executed successfully", name)
                         return raw_result
 
-            logger.info(f"Tool {name} executed successfully")
+            logger.info("Tool %s executed successfully", name)
             return raw_result
 
         except Exception as e:
@@ -394,7 +394,9 @@ def chat(
         memory_store = MemoryStore(ws)
         session_manager = SessionManager(ws)
         skills_loader = SkillsLoader(ws)
-        context_builder = ContextBuilder(ws, skills_loader=skills_loader)
+        context_builder = ContextBuilder(
+            ws, skills_loader=skills_loader, memory_store=memory_store
+        )
         tools = setup_tools(ws, api_key)
 
         # Show status
@@ -0,0 +1,234 @@
+"""Tests for AgentLoop tool call normalization and execution."""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from app.application.services.agent_loop import (
+    AgentLoop,
+    ParsedToolCall,
+    _normalize_tool_calls,
+)
+from app.infrastructure.bus.events import InboundMessage
+from app.infrastructure.bus.queue import MessageBus
+
+
+def _object_call(name, arguments, call_id=None) -> SimpleNamespace:
+    """Build a LiteLLM-style tool call object."""
+    function = SimpleNamespace(name=name, arguments=arguments)
+    return SimpleNamespace(id=call_id, function=function)
+
+
+class TestNormalizeToolCalls:
+    """Test suite for _normalize_tool_calls."""
+
+    def test_dict_call_with_string_arguments(self):
+        """Test OpenAI-style dicts keep their id and raw argument string."""
+        raw = '{"path": "a.txt", "n": 2}'
+        calls = _normalize_tool_calls(
+            [{"id": "abc", "function": {"name": "read", "arguments": raw}}]
+        )
+
+        assert calls == [ParsedToolCall("abc", "read", {"path": "a.txt", "n": 2}, raw)]
+
+    def test_object_call_with_dict_arguments(self):
+        """Test already parsed arguments are re-encoded for the transcript."""
+        calls = _normalize_tool_calls([_object_call("search", {"q": "café"}, "x1")])
+
+        assert calls[0].id == "x1"
+        assert calls[0].args == {"q": "café"}
+        assert json.loads(calls[0].args_json) == {"q": "café"}
+
+    def test_empty_arguments(self):
+        """Test missing or empty arguments normalize to an empty dict."""
+        calls = _normalize_tool_calls(
+            [
+                {"id": "a", "function": {"name": "now", "arguments": ""}},
+                {"id": "b", "function": {"name": "now"}},
+                _object_call("now", None, "c"),
+            ]
+        )
+
+        assert [call.args for call in calls] == [{}, {}, {}]
+        assert [call.args_json for call in calls[1:]] == ["{}", "{}"]
+
+    def test_fallback_ids_continue_from_offset(self):
+        """Test calls without ids are numbered from id_offset, skipping dropped."""
+        calls = _normalize_tool_calls(
+            [
+                _object_call("a", "{}"),
+                _object_call("", "{}"),
+                {"function": {"name": "b", "arguments": "{}"}},
+                {"id": "kept", "function": {"name": "c", "arguments": "{}"}},
+            ],
+            id_offset=3,
+        )
+
+        assert [(call.id, call.name) for call in calls] == [
+            ("call_3", "a"),
+            ("call_4", "b"),
+            ("kept", "c"),
+        ]
+
+
+class _ScriptedLLM:
+    """LLM client stub that requests two tools, then answers."""
+
+    def __init__(self, failing: str):
+        self.failing = failing
+        self.calls = 0
+
+    async def chat_completion(self, messages, tools=None, streaming=False):
+        self.calls += 1
+        if self.calls == 1:
+            return {
+                "response": "",
+                "tool_calls": [
+                    {"id": "1", "function": {"name": "ok", "arguments": "{}"}},
+                    {"id": "2", "function": {"name": self.failing, "arguments": ""}},
+                ],
+            }
+        return {"response": "done"}
+
+
+class _Tools:
+    """Tool registry stub whose tools return or raise the mapped value."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+
+    def get_definitions(self):
+        return []
+
+    async def execute(self, name, args):
+        outcome = self.outcomes[name]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class TestToolExecution:
+    """Test suite for concurrent tool execution in the agent loop."""
+
+    def _loop(self, workspace, failing, error) -> AgentLoop:
+        """Build an agent loop whose second tool raises error."""
+        tools = _Tools({"ok": "fine", failing: error})
+        return AgentLoop(MessageBus(), _ScriptedLLM(failing), workspace, tools)
+
+    @pytest.mark.asyncio
+    async def test_tool_errors_become_tool_messages(self, temp_workspace):
+        """Test an Exception from one tool is reported and the loop continues."""
+        loop = self._loop(temp_workspace, "bad", ValueError("boom"))
+        messages = [{"role": "user", "content": "hi"}]
+
+        content, tools_used = await loop._run_agent_loop(messages)
+
+        assert content == "done"
+        assert tools_used == ["ok", "bad"]
+        assert [m["content"] for m in messages if m["role"] == "tool"] == [
+            "fine",
+            "Error executing bad: boom",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates(self, temp_workspace):
+        """Test a CancelledError from a tool is re-raised, not fed to the LLM."""
+        loop = self._loop(temp_workspace, "cancelled", asyncio.CancelledError())
+        messages = [{"role": "user", "content": "hi"}]
+
+        with pytest.raises(asyncio.CancelledError):
+            await loop._run_agent_loop(messages)
+
+        assert not any(m["role"] == "tool" for m in messages)
+
+
+def _inbound(channel: str, content: str) -> InboundMessage:
+    """Build an inbound message from a fixed sender."""
+    return InboundMessage(
+        channel=channel, sender_id="u1", chat_id="c1", content=content
+    )
+
+
+class _EchoLLM:
+    """LLM client stub that answers every prompt without tools."""
+
+    async def chat_completion(self, messages, tools=None, streaming=False):
+        return {"response": f"re: {messages[-1]['content']}"}
+
+
+class TestRunLoop:
+    """Test suite for the inbound -> outbound agent loop."""
+
+    @pytest.mark.asyncio
+    async def test_channel_without_consumer_does_not_stall_others(
+        self, temp_workspace
+    ):
+        """Test replies for an unconsumed channel never block other channels."""
+        bus = MessageBus(outbound_max=2)
+        loop = AgentLoop(bus, _EchoLLM(), temp_workspace, _Tools({}))
+        for i in range(5):
+            await bus.publish_inbound(_inbound("ghost", str(i)))
+        await bus.publish_inbound(_inbound("cli", "hi"))
+
+        await loop.start()
+        try:
+            reply = await asyncio.wait_for(bus.consume_outbound("cli"), 5)
+        finally:
+            await loop.stop()
+
+        assert reply.content == "re: hi"
+        ghost = bus.outbound["ghost"]
+        assert [ghost.get_nowait().content for _ in range(ghost.qsize())] == [
+            "re: 3",
+            "re: 4",
+        ]
+
+
+class TestSessionFlush:
+    """Test suite for the background session flush."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_cannot_overwrite_newer_state(self, temp_workspace):
+        """Test a write left running by cancellation lands before the next one."""
+        loop = AgentLoop(MessageBus(), _EchoLLM(), temp_workspace, _Tools({}))
+        manager = loop.session_manager
+        write_snapshots = manager.write_snapshots
+        release, first_done = threading.Event(), threading.Event()
+
+        def held_first_write(snapshots):
+            if first_done.is_set() or release.is_set():
+                return write_snapshots(snapshots)
+            release.wait(1)
+            try:
+                return write_snapshots(snapshots)
+            finally:
+                first_done.set()
+
+        manager.write_snapshots = held_first_write
+        session = manager.get_or_create("cli:c1")
+        session.add_message("user", "old")
+        manager.save_later(session)
+
+        flush = asyncio.create_task(loop._flush_sessions())
+        await asyncio.sleep(0.05)
+        flush.cancel()
+        session.add_message("user", "new")
+        manager.save_later(session)
+        second = asyncio.create_task(loop._flush_sessions())
+        await asyncio.sleep(0.05)
+        release.set()
+        await second
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+        await asyncio.to_thread(first_done.wait, 1)
+
+        manager.invalidate("cli:c1")
+        saved = manager.get_or_create("cli:c1")
+        assert [m.content for m in saved.messages] == ["old", "new"]
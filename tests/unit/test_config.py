@@ -0,0 +1,34 @@
+"""Tests for environment-based settings parsing."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from app.adapters.config import _env_bool
+
+
+class TestEnvBool:
+    """Test suite for _env_bool."""
+
+    @pytest.mark.parametrize(
+        "value", ["1", "t", "true", "y", "yes", "on", "TRUE", "Yes", " on "]
+    )
+    def test_truthy_spellings(self, monkeypatch, value):
+        """Test every spelling pydantic-settings treats as true is accepted."""
+        monkeypatch.setenv("NOVA_TEST_FLAG", value)
+        assert _env_bool("NOVA_TEST_FLAG", "false") is True
+
+    @pytest.mark.parametrize("value", ["0", "f", "false", "n", "no", "off", ""])
+    def test_falsy_spellings(self, monkeypatch, value):
+        """Test false spellings and empty values are rejected."""
+        monkeypatch.setenv("NOVA_TEST_FLAG", value)
+        assert _env_bool("NOVA_TEST_FLAG", "true") is False
+
+    def test_default_when_unset(self, monkeypatch):
+        """Test the default string is parsed when the variable is missing."""
+        monkeypatch.delenv("NOVA_TEST_FLAG", raising=False)
+        assert _env_bool("NOVA_TEST_FLAG", "true") is True
+        assert _env_bool("NOVA_TEST_FLAG", "false") is False
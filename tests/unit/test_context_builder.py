@@ -0,0 +1,44 @@
+"""Tests for ContextBuilder system prompt caching."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from app.infrastructure.skills.context import ContextBuilder
+
+
+def _rewrite_keeping_mtime(path, text: str) -> None:
+    """Replace a file's content but leave its mtime unchanged."""
+    st = os.stat(path)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+class TestPromptCache:
+    """Test suite for the cached system prompt."""
+
+    def test_reused_until_memory_changes(self, temp_workspace):
+        """Test the prompt is rebuilt only after MEMORY.md changes."""
+        builder = ContextBuilder(temp_workspace)
+        builder.memory_store.write_long_term("first fact")
+
+        prompt = builder.build_system_prompt()
+        assert builder.build_system_prompt() is prompt
+
+        builder.memory_store.write_long_term("second fact")
+        assert "second fact" in builder.build_system_prompt()
+
+    def test_same_mtime_rewrite_is_detected(self, temp_workspace):
+        """Test a rewrite within the mtime granularity still invalidates."""
+        builder = ContextBuilder(temp_workspace)
+        builder.memory_store.write_long_term("short")
+        (temp_workspace / "USER.md").write_text("name: A", encoding="utf-8")
+        builder.build_system_prompt()
+
+        _rewrite_keeping_mtime(builder.memory_store.memory_file, "much longer fact")
+        _rewrite_keeping_mtime(temp_workspace / "USER.md", "name: Alice")
+        prompt = builder.build_system_prompt()
+
+        assert "much longer fact" in prompt
+        assert "name: Alice" in prompt
@@ -0,0 +1,283 @@
+"""Tests for CronService scheduling and persistence."""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from app.infrastructure.cron.service import CronJob, CronService
+
+
+def _read_log(service: CronService) -> list[dict]:
+    """Parse the service's NDJSON job log."""
+    with open(service.jobs_file, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _reload(service: CronService) -> CronService:
+    """Load a fresh service from the same workspace."""
+    reloaded = CronService(service.workspace)
+    reloaded._load_jobs()
+    return reloaded
+
+
+def _job(schedule_type: str, **kwargs) -> CronJob:
+    """Build a job with placeholder identity fields."""
+    return CronJob(id="j", name="j", message="m", schedule_type=schedule_type, **kwargs)
+
+
+class TestNextFireAfter:
+    """Test suite for CronJob.next_fire_after."""
+
+    NOW = datetime(2026, 10, 16, 10, 5, 30)  # a Friday
+
+    def test_once_fires_at_time(self):
+        """Test a future one-time job fires at its 'at' time."""
+        job = _job("once", at="2026-10-16T12:00:00")
+        assert job.next_fire_after(self.NOW) == datetime(2026, 10, 16, 12, 0)
+
+    def test_once_skipped_when_missed_or_run(self):
+        """Test one-time jobs past the grace window or already run never fire."""
+        assert _job("once", at="2026-10-16T10:00:00").next_fire_after(self.NOW) is None
+        job = _job("once", at="2026-10-16T12:00:00")
+        job.mark_run(self.NOW)
+        assert job.next_fire_after(self.NOW) is None
+
+    def test_interval_counts_from_last_run(self):
+        """Test interval jobs fire now, then every seconds after each run."""
+        job = _job("interval", every=90)
+        assert job.next_fire_after(self.NOW) == self.NOW
+        job.mark_run(self.NOW)
+        assert job.next_fire_after(self.NOW) == self.NOW + timedelta(seconds=90)
+
+    @pytest.mark.parametrize(
+        "expr, expected",
+        [
+            ("* * * * *", datetime(2026, 10, 16, 10, 6)),
+            ("5 10 * * *", datetime(2026, 10, 17, 10, 5)),
+            ("0 9 * * 0", datetime(2026, 10, 19, 9, 0)),  # Monday=0
+            ("30 8 1 * *", datetime(2026, 11, 1, 8, 30)),
+            ("0 0 29 2 *", datetime(2028, 2, 29, 0, 0)),
+        ],
+    )
+    def test_cron_next_match(self, expr, expected):
+        """Test cron jobs fire at the first matching minute after now."""
+        assert _job("cron", cron=expr).next_fire_after(self.NOW) == expected
+
+    @pytest.mark.parametrize("expr", ["bad", "* * * *", "x * * * *", "0 0 31 2 *"])
+    def test_cron_invalid_or_impossible(self, expr):
+        """Test unparsable or never-matching expressions don't fire."""
+        assert _job("cron", cron=expr).next_fire_after(self.NOW) is None
+
+
+class TestScheduler:
+    """Test suite for the heap-driven run loop."""
+
+    @pytest.mark.asyncio
+    async def test_runs_due_jobs_and_reschedules(self, temp_workspace):
+        """Test added jobs wake the loop, fire when due and are rescheduled."""
+        fired = []
+
+        async def on_job(message, to, channel):
+            fired.append(message)
+
+        service = CronService(temp_workspace, on_job=on_job)
+        await service.start()
+        try:
+            service.add_job("tick", "tick", schedule_type="interval", every=1)
+            soon = (datetime.now() + timedelta(seconds=0.3)).isoformat()
+            service.add_job("once", "once", at=soon)
+            removed = service.add_job("gone", "gone", schedule_type="interval", every=1)
+            service.remove_job(removed)
+            await asyncio.sleep(1.5)
+        finally:
+            await service.stop()
+
+        assert fired.count("tick") == 2
+        assert fired.count("once") == 1
+        assert "gone" not in fired
+        assert [job.name for job in service.jobs] == ["tick"]
+        assert [job_id for _, job_id in service._heap] == [service.jobs[0].id]
+
+
+class TestJobLog:
+    """Test suite for the NDJSON job log."""
+
+    def test_changes_persist_without_start(self, temp_workspace):
+        """Test add and remove on a service that was never started hit disk."""
+        service = CronService(temp_workspace)
+        kept = service.add_job("a", "A", schedule_type="interval", every=60)
+        removed = service.add_job("b", "B", schedule_type="interval", every=60)
+        service.remove_job(removed)
+
+        assert not service._pending
+        assert [job.id for job in _reload(service).jobs] == [kept]
+
+    @pytest.mark.asyncio
+    async def test_changes_after_stop_persist(self, temp_workspace):
+        """Test a stopped service writes changes without its flush loop."""
+        service = CronService(temp_workspace, flush_interval=3600)
+        await service.start()
+        await service.stop()
+
+        job_id = service.add_job("a", "A", schedule_type="interval", every=60)
+
+        assert [job.id for job in _reload(service).jobs] == [job_id]
+
+    @pytest.mark.asyncio
+    async def test_reload_round_trip(self, temp_workspace):
+        """Test jobs written by one service are reloaded by the next."""
+        service = CronService(temp_workspace)
+        kept = service.add_job("tea", "Drink tea", schedule_type="interval", every=60)
+        removed = service.add_job("gone", "Bye", schedule_type="cron", cron="0 9 * * *")
+        service.remove_job(removed)
+        await service._flush()
+
+        reloaded = _reload(service)
+
+        assert [job.to_dict() for job in reloaded.jobs] == [
+            service._jobs_by_id[kept].to_dict()
+        ]
+        assert reloaded._log_size == service.jobs_file.stat().st_size
+
+    @pytest.mark.asyncio
+    async def test_flush_appends_only_changes(self, temp_workspace):
+        """Test a flush appends one coalesced record per changed job."""
+        service = CronService(temp_workspace, flush_interval=3600)
+        await service.start()
+        try:
+            first = service.add_job("a", "A", schedule_type="interval", every=60)
+            await service._flush()
+
+            second = service.add_job("b", "B", schedule_type="interval", every=60)
+            service._jobs_by_id[second].run_count = 3
+            service._record_upsert(service._jobs_by_id[second])
+            service.remove_job(first)
+            await service._flush()
+            log = _read_log(service)
+        finally:
+            await service.stop()
+
+        assert [record["op"] for record in log] == ["upsert", "upsert", "delete"]
+        assert log[1]["job"]["run_count"] == 3
+        assert log[2] == {"op": "delete", "id": first}
+        assert [job.id for job in _reload(service).jobs] == [second]
+
+    @pytest.mark.asyncio
+    async def test_compaction_rewrites_snapshot(self, temp_workspace):
+        """Test a log past the size threshold is replaced by a snapshot."""
+        service = CronService(temp_workspace)
+        for i in range(3):
+            service.add_job(f"job{i}", "x", schedule_type="interval", every=60)
+            await service._flush()
+        service.remove_job(service.jobs[0].id)
+        await service._flush()
+        assert len(_read_log(service)) == 4
+
+        service._compact_at = 1
+        await service._flush()
+
+        log = _read_log(service)
+        assert [record["job"]["id"] for record in log] == [
+            job.id for job in service.jobs
+        ]
+        assert service._log_size == service.jobs_file.stat().st_size
+
+    @pytest.mark.asyncio
+    async def test_migrates_legacy_json(self, temp_workspace):
+        """Test cron_jobs.json is read and rewritten as the job log."""
+        job = CronJob(
+            id="old1", name="old", message="m", schedule_type="cron", cron="0 9 * * *"
+        )
+        (temp_workspace / "cron_jobs.json").write_text(
+            json.dumps({"jobs": [job.to_dict()]}), encoding="utf-8"
+        )
+
+        service = CronService(temp_workspace)
+        service._load_jobs()
+        assert [j.id for j in service.jobs] == ["old1"]
+        await service._flush()
+
+        assert _read_log(service) == [{"op": "upsert", "job": job.to_dict()}]
+        assert [j.id for j in _reload(service).jobs] == ["old1"]
+
+    @pytest.mark.asyncio
+    async def test_job_added_before_start_survives_compaction(self, temp_workspace):
+        """Test a job added before start() is scheduled and kept by compaction."""
+        service = CronService(temp_workspace, flush_interval=3600)
+        job_id = service.add_job("early", "m", schedule_type="cron", cron="0 9 * * *")
+
+        await service.start()
+        try:
+            assert [job.id for job in service.jobs] == [job_id]
+            assert [queued for _, queued in service._heap] == [job_id]
+            service._compact_at = 1
+            await service._flush()
+        finally:
+            await service.stop()
+
+        assert [job.id for job in _reload(service).jobs] == [job_id]
+
+    @pytest.mark.asyncio
+    async def test_changes_while_loading_are_merged(self, temp_workspace):
+        """Test jobs added or removed during start()'s load are not lost."""
+        service = CronService(temp_workspace, flush_interval=3600)
+        old = service.add_job("old", "m", schedule_type="cron", cron="0 9 * * *")
+
+        start = asyncio.create_task(service.start())
+        await asyncio.sleep(0)
+        new = service.add_job("new", "m", schedule_type="cron", cron="0 9 * * *")
+        assert service.remove_job(old)
+        await start
+        try:
+            assert [job.id for job in service.jobs] == [new]
+            assert [queued for _, queued in service._heap] == [new]
+            service._compact_at = 1
+            await service._flush()
+        finally:
+            await service.stop()
+
+        assert [job.id for job in _reload(service).jobs] == [new]
+
+    @pytest.mark.asyncio
+    async def test_torn_line_is_skipped_and_compacted(self, temp_workspace):
+        """Test a partial last line is ignored and triggers a rewrite."""
+        service = CronService(temp_workspace)
+        job_id = service.add_job("a", "A", schedule_type="interval", every=60)
+        await service._flush()
+        with open(service.jobs_file, "a", encoding="utf-8") as f:
+            f.write('{"op": "ups')
+
+        reloaded = _reload(service)
+        assert [job.id for job in reloaded.jobs] == [job_id]
+        assert reloaded._compact_next
+
+        await reloaded._flush()
+        assert [record["job"]["id"] for record in _read_log(reloaded)] == [job_id]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_does_not_overlap_next_flush(self, temp_workspace):
+        """Test a flush cancelled mid-write finishes before the next one runs."""
+        service = CronService(temp_workspace, flush_interval=3600)
+        await service.start()
+        for i in range(50):
+            service.add_job(f"job{i}", "x" * 100, schedule_type="interval", every=60)
+
+        flush = asyncio.create_task(service._flush())
+        await asyncio.sleep(0)
+        flush.cancel()
+        service.add_job("late", "y", schedule_type="interval", every=60)
+        await service._flush()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+        await service.stop()
+
+        reloaded = _reload(service)
+        assert len(reloaded.jobs) == 51
+        assert not reloaded._compact_next
+        assert reloaded._log_size == service._log_size
@@ -0,0 +1,124 @@
+"""Tests for MemoryStore section updates and history search."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from app.infrastructure.memory.store import MemoryStore
+
+
+class TestUpdateSection:
+    """Test suite for MemoryStore.update_section."""
+
+    def test_replaces_existing_section(self, temp_workspace):
+        """Test an existing section body is replaced in place."""
+        store = MemoryStore(temp_workspace)
+
+        store.update_section("Preferences", "likes tea")
+
+        content = store.read_long_term()
+        assert "## Preferences\n\nlikes tea\n\n## Projects" in content
+        assert content.count("## Preferences") == 1
+
+    def test_appends_missing_section(self, temp_workspace):
+        """Test a missing section is added at the end."""
+        store = MemoryStore(temp_workspace)
+
+        store.update_section("Hobbies", "chess")
+
+        assert store.read_long_term().endswith("\n## Hobbies\n\nchess\n")
+
+    def test_header_must_match_whole_line(self, temp_workspace):
+        """Test a section name that prefixes another header is not matched."""
+        store = MemoryStore(temp_workspace)
+
+        store.update_section("User", "someone")
+
+        content = store.read_long_term()
+        assert "## User Information\n\n## Preferences" in content
+        assert content.endswith("\n## User\n\nsomeone\n")
+
+    def test_nested_header_in_content_survives_repeated_updates(
+        self, temp_workspace, tmp_path
+    ):
+        """Test a warm cache matches a fresh parse when content has "## " lines."""
+        updates = [
+            ("Preferences", "likes tea\n## Drinks\ngreen"),
+            ("Preferences", "likes coffee"),
+            ("Drinks", "black"),
+        ]
+
+        warm = MemoryStore(temp_workspace)
+        for section, content in updates:
+            warm.update_section(section, content)
+
+        # Same updates, each through a new store so nothing is cached
+        for section, content in updates:
+            MemoryStore(tmp_path).update_section(section, content)
+
+        assert warm.read_long_term() == MemoryStore(tmp_path).read_long_term()
+        assert "## Drinks\n\nblack\n" in warm.read_long_term()
+
+    def test_picks_up_external_edits(self, temp_workspace):
+        """Test the section cache is dropped when MEMORY.md changes on disk."""
+        store = MemoryStore(temp_workspace)
+        store.update_section("Preferences", "likes tea")
+
+        store.memory_file.write_text(
+            store.read_long_term() + "\n## Extra\n\nold\n", encoding="utf-8"
+        )
+        store.update_section("Extra", "new")
+
+        content = store.read_long_term()
+        assert content.endswith("## Extra\n\nnew\n")
+        assert "likes tea" in content
+
+
+class TestSearchHistory:
+    """Test suite for MemoryStore.search_history."""
+
+    def _write_history(self, store: MemoryStore, text: str) -> None:
+        """Replace HISTORY.md with raw text."""
+        store.history_file.write_text(text, encoding="utf-8")
+
+    def test_returns_matching_entries_case_insensitively(self, temp_workspace):
+        """Test only entries containing the query are returned, in order."""
+        store = MemoryStore(temp_workspace)
+        store.append_history("Talked about Python packaging")
+        store.append_history("Planned a trip to Rome")
+        store.append_history("More python: asyncio")
+
+        matches = store.search_history("PYTHON")
+
+        assert len(matches) == 2
+        assert matches[0].startswith("## [")
+        assert "Python packaging" in matches[0]
+        assert "asyncio" in matches[1]
+
+    def test_entry_text_matches_line_based_split(self, temp_workspace):
+        """Test entry boundaries: header line through the line before the next."""
+        store = MemoryStore(temp_workspace)
+        self._write_history(
+            store, "# Conversation History\n\nintro foo\n\n## [a]\nfoo\n## [b]\nbar\n"
+        )
+
+        assert store.search_history("foo") == ["## [a]\nfoo"]
+        assert store.search_history("bar") == ["## [b]\nbar\n"]
+        assert store.search_history("## [") == ["## [a]\nfoo", "## [b]\nbar\n"]
+
+    def test_preamble_and_straddling_hits_are_ignored(self, temp_workspace):
+        """Test hits before the first entry or across two entries don't match."""
+        store = MemoryStore(temp_workspace)
+        self._write_history(store, "intro\n## [a]\nfoo\n## [b]\nbar")
+
+        assert store.search_history("intro") == []
+        assert store.search_history("foo\n## [b]") == []
+        assert store.search_history("") == ["## [a]\nfoo", "## [b]\nbar"]
+
+    def test_missing_file_returns_empty(self, temp_workspace):
+        """Test a missing HISTORY.md yields no matches."""
+        store = MemoryStore(temp_workspace)
+        store.history_file.unlink()
+
+        assert store.search_history("anything") == []
@@ -0,0 +1,100 @@
+"""Tests for MessageBus queueing and routing."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from app.infrastructure.bus.events import InboundMessage, OutboundMessage
+from app.infrastructure.bus.queue import MessageBus
+
+
+def _inbound(content: str) -> InboundMessage:
+    """Build an inbound message from a fixed sender."""
+    return InboundMessage(channel="cli", sender_id="u1", chat_id="c1", content=content)
+
+
+def _outbound(channel: str, content: str) -> OutboundMessage:
+    """Build an outbound message for a fixed chat."""
+    return OutboundMessage(channel=channel, chat_id="c1", content=content)
+
+
+class TestInboundQueue:
+    """Test suite for the bounded inbound queue."""
+
+    @pytest.mark.asyncio
+    async def test_publish_waits_when_full(self):
+        """Test publish_inbound applies backpressure until a slot frees up."""
+        bus = MessageBus(inbound_max=1)
+        await bus.publish_inbound(_inbound("first"))
+
+        blocked = asyncio.create_task(bus.publish_inbound(_inbound("second")))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        assert (await bus.consume_inbound()).content == "first"
+        await asyncio.wait_for(blocked, 1)
+        assert (await bus.consume_inbound()).content == "second"
+
+    @pytest.mark.asyncio
+    async def test_try_publish_drops_oldest_when_full(self):
+        """Test try_publish_inbound makes room by discarding the oldest message."""
+        bus = MessageBus(inbound_max=2)
+
+        assert bus.try_publish_inbound(_inbound("a"))
+        assert bus.try_publish_inbound(_inbound("b"))
+        assert not bus.try_publish_inbound(_inbound("c"))
+
+        assert bus.inbound.qsize() == 2
+        assert (await bus.consume_inbound()).content == "b"
+        assert (await bus.consume_inbound()).content == "c"
+        await asyncio.wait_for(bus.inbound.join(), 1)
+
+
+class TestOutboundRouting:
+    """Test suite for per-channel outbound queues."""
+
+    @pytest.mark.asyncio
+    async def test_routes_to_each_channel(self):
+        """Test each channel only consumes its own messages, in order."""
+        bus = MessageBus()
+        bus.register_outbound_channel("cli")
+        bus.register_outbound_channel("telegram")
+
+        await bus.publish_outbound(_outbound("telegram", "t1"))
+        await bus.publish_outbound(_outbound("cli", "c1"))
+        await bus.publish_outbound(_outbound("telegram", "t2"))
+
+        assert (await bus.consume_outbound("telegram")).content == "t1"
+        assert (await bus.consume_outbound("telegram")).content == "t2"
+        assert (await bus.consume_outbound("cli")).content == "c1"
+        assert bus.outbound["telegram"].empty()
+
+    @pytest.mark.asyncio
+    async def test_unregistered_channel_keeps_replies(self, caplog):
+        """Test replies for a channel that starts late are queued, not dropped."""
+        bus = MessageBus()
+
+        await bus.publish_outbound(_outbound("late", "hello"))
+        await bus.publish_outbound(_outbound("late", "again"))
+
+        assert caplog.text.count("No outbound consumer registered") == 1
+        assert bus.register_outbound_channel("late").qsize() == 2
+        assert (await bus.consume_outbound("late")).content == "hello"
+
+    @pytest.mark.asyncio
+    async def test_full_channel_drops_oldest_without_waiting(self, caplog):
+        """Test publishing to a backed-up channel evicts its oldest reply."""
+        bus = MessageBus(outbound_max=2)
+        bus.register_outbound_channel("slow")
+
+        for content in ("s1", "s2", "s3"):
+            await asyncio.wait_for(bus.publish_outbound(_outbound("slow", content)), 1)
+
+        assert "Outbound queue for slow full" in caplog.text
+        assert (await bus.consume_outbound("slow")).content == "s2"
+        assert (await bus.consume_outbound("slow")).content == "s3"
+        await asyncio.wait_for(bus.outbound["slow"].join(), 1)